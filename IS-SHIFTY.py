@@ -1,6 +1,21 @@
-from game import game
+from game import create_game
+from argparse import ArgumentParser
 
 if __name__ == '__main__':
+    parser = ArgumentParser()
+    parser.add_argument('--warm-cache', action='store_true',
+                        help='save processed images of all levels in the disk cache & quit')
+    parser.add_argument('--hot-reload', action='store_true',
+                        help='reload asset files changed while the game is running (for making assets)')
+    args = parser.parse_args()
+
+    game = create_game({'HOT_RELOAD': True} if args.hot_reload else None)
+
+    # make the disk cache ahead of time (faster first start)
+    if args.warm_cache:
+        stats = game.warm_cache()
+        print(f'Disk cache ready ({stats["misses"]} saved, {stats["hits"]} already cached)')
+        game.quit_game()
 
     while game.running:
         game.current_menu.display_menu()
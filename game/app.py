@@ -0,0 +1,826 @@
+from . import pg, vec
+from .config import WIDTH, HEIGHT, FPS, TARGET_FPS, GAME_TITLE, MAP1, MAP2, MAP3, PAUSE_COLOR, TILE_COLOR, \
+    CULL_SPRITES, DIRTY_RECTS, DIRECT_PRESENT, MIXER_SETTINGS, HOT_RELOAD
+from .images import PLAYER_SPRITE_SHEET, ZOMBIE_SPRITE_SHEET, EXPLOSION_SPRITE_SHEET
+from .sounds import BG_MUSIC
+from .audio import MusicTrack, sound_registry
+from .menu import MainMenu, SettingsMenu, HighScoresMenu, HowToPlayMenu, CreditsMenu, ConfirmationMenu, PauseMenu, \
+    GameOverMenu
+from .spritesheet import SpriteSheet
+from .frames import EffectFrames
+from .cache import asset_cache
+from .surface_cache import surface_cache
+from .fonts import font_registry
+from .loader import asset_loader, get_manifest
+from .hotreload import AssetWatcher
+from .tilemap import TiledMap, Camera
+from .spatial import SpatialLayeredUpdates
+from .dirty import DirtyTracker
+from .render import ScaledRenderer
+from .hud import Hud
+from .timer import GameTimer
+from .sprites import Player, Zombie, Obstacle, Acid, Spikes, Saw, LaserMachine, LaserBeam, LaserReceiver, Door, \
+    DoorSwitch, Lever, Item
+
+
+class Game:
+    """
+    Main game class.
+    """
+
+    def __init__(self):
+        """
+        Initialize the game and all game related data.
+        """
+
+        # initialization
+        pg.mixer.pre_init(*MIXER_SETTINGS)
+        pg.init()
+
+        # display
+        self.__screen_size = (WIDTH, HEIGHT)
+        self.window = pg.display.set_mode(self.__screen_size, pg.FULLSCREEN)
+        pg.display.set_caption(GAME_TITLE)
+
+        # start loading images & sounds in background (menu shows as soon as its own assets are loaded)
+        asset_loader.start(get_manifest())
+
+        # open fonts used by buttons & HUD once (shared by everything that renders text)
+        font_registry.preload()
+
+        # everything is drawn on the display
+        # without post-processing, the display is the window itself (no full screen copy every frame)
+        self.__post_processes = []  # post-processing passes, applied before the frame is shown
+        self.__offscreen_display = None
+        self.display = self.window
+        if not self.__can_draw_on_window():
+            self.__set_offscreen_display()
+        self.__dirty_tracker = DirtyTracker()  # for redrawing only what changed (dirty rects mode)
+        self.__renderer = None  # for drawing the world at a lower resolution (set in settings)
+        self.__map = None  # level map (made when a level starts)
+        self.player = None  # spawned when a level starts
+
+        # timer, clock...
+        self.timer = pg.USEREVENT + 1
+        self.__clock = pg.time.Clock()
+
+        # changed asset files are reloaded while the game is running (dev mode)
+        self.__asset_watcher = AssetWatcher() if HOT_RELOAD else None
+
+        # sound channel
+        self.__channel1 = pg.mixer.Channel(0)
+
+        # flags
+        self.running = True
+        self.playing = False
+        self.paused = False
+        self.game_over = False
+        self.click = False
+        self.time_up = False
+        self.level_up = False
+
+        # ===== Menus =====
+        self.main_menu = MainMenu(self)
+        self.settings_menu = SettingsMenu(self)
+        self.high_scores_menu = HighScoresMenu(self)
+        self.how_to_play_menu = HowToPlayMenu(self)
+        self.credits_menu = CreditsMenu(self)
+        self.confirmation_menu = ConfirmationMenu(self)
+        self.__pause_menu = PauseMenu(self)
+        self.__game_over_menu = GameOverMenu(self)
+        self.current_menu = self.main_menu
+
+        # load all game data
+        self.__load_data()
+
+        # levels
+        self.level = 1
+
+    def __load_data(self) -> None:
+        """
+        Load game data (maps, sprite sheets...).
+        """
+
+        # maps
+        self.__level_1_map = MAP1
+        self.__level_2_map = MAP2
+        self.__level_3_map = MAP3
+
+        # sprite sheets
+        self.player_sprite_sheet = SpriteSheet(PLAYER_SPRITE_SHEET, True)
+        self.zombies_sprite_sheet = SpriteSheet(ZOMBIE_SPRITE_SHEET, True)
+        self.explosion_sprite_sheet = SpriteSheet(EXPLOSION_SPRITE_SHEET)
+
+        # bullets & effects frames (made on the first level start, shared by every bullet & effect)
+        self.effect_frames = None
+
+        # dim screen image (pause menu)
+        self.pause_dim_image = pg.Surface(self.__screen_size).convert_alpha()
+        self.pause_dim_image.fill(PAUSE_COLOR)
+
+        # default font
+        self.default_font = font_registry.get_sys_font('Arial', 30)
+
+        # HUD (rendered only when its values change)
+        self.__hud = Hud(self.default_font)
+
+        # background music (streamed, plays if turned on in settings)
+        self.game_music = MusicTrack(BG_MUSIC, 0.5)
+
+    def run(self) -> None:
+        """
+        Run the game.
+        Main game loop.
+        """
+
+        # make game timer
+        self.game_timer = GameTimer(self)
+
+        self.playing = True
+        if self.playing:
+            self.__level_1()
+            # play game music (if turned on in settings)
+            if self.main_menu.game_music_on:
+                self.game_music.play(-1)
+
+        while self.playing:
+            self.delta_time = min(self.__clock.tick(FPS) * 0.001 * TARGET_FPS, 3)
+            self.__events()  # manage events
+            self.reload_changed_assets()  # dev mode
+
+            # not paused
+            if not self.paused:
+                # unpause game music and sounds
+                pg.mixer.music.unpause()
+                pg.mixer.unpause()
+
+                # if not game over
+                if not self.game_over:
+                    self.__update()  # update
+            # paused
+            else:
+                self.__pause_menu.display_menu()  # display pause menu
+
+            # draw everything
+            self.__draw()
+
+    def __events(self) -> None:
+        """
+        Manage game events.
+        """
+        for event in pg.event.get():
+            # quit game
+            if event.type == pg.QUIT:
+                self.quit_game()
+
+            # game timer
+            if event.type == self.timer:
+                self.game_timer.countdown()
+
+            # key down
+            if event.type == pg.KEYDOWN:
+                pressed_keys = pg.key.get_pressed()
+
+                # quit game (alt-f4)
+                if event.key == pg.K_F4 and (pressed_keys[pg.K_LALT] or pressed_keys[pg.K_RALT]):
+                    self.quit_game()
+
+                # pause
+                if self.playing and not self.game_over:
+                    if event.key == pg.K_ESCAPE:
+                        self.paused = not self.paused
+
+                # player movement (jump & slide)
+                if self.playing:
+                    # jump
+                    if event.key == self.player.get_control_key('jump'):
+                        self.player.jump()
+                    # slide
+                    elif event.key == self.player.get_control_key('slide'):
+                        self.player.slide()
+
+            # key up
+            if event.type == pg.KEYUP:
+                if self.playing:
+                    # short jump
+                    if event.key == self.player.get_control_key('jump'):
+                        self.player.jump_cut()
+
+            # mouse click
+            if event.type == pg.MOUSEBUTTONUP:
+                # only when paused or game over
+                if self.paused or self.game_over:
+                    if event.button == 1:
+                        self.click = True
+
+    def __draw(self) -> None:
+        """
+        Draw everything.
+        In dirty rects mode, while playing, only the parts of the screen that changed are redrawn.
+        """
+        view_rect = self.__camera.get_view_rect()
+        sprites = self.__get_sprites_to_draw()
+        playing = not self.paused and not self.game_over
+
+        # redraw only what changed (if the camera didn't move)
+        dirty_rects_on = self.__is_dirty_rects_on()
+        if dirty_rects_on and playing and not self.__dirty_tracker.needs_full_redraw(view_rect):
+            self.__draw_dirty(sprites)
+            return
+
+        # draw map & sprites
+        self.__draw_world(sprites)
+
+        hud_rects = []
+        # drawing if not paused or game over
+        if playing:
+            hud_rects = self.__draw_hud()
+        # draw game over menu
+        elif self.game_over:
+            self.__game_over_menu.display_menu()
+
+        # remember what was drawn (dirty rects mode)
+        if DIRTY_RECTS:
+            if playing and dirty_rects_on:
+                self.__dirty_tracker.record(sprites, self.__camera, view_rect, hud_rects)
+            else:
+                self.__dirty_tracker.invalidate()  # menus are drawn over the game
+
+        # draw everything
+        self.__copy_to_window()
+
+        # update the display if not paused (fixes pause bug)
+        if not self.paused:
+            pg.display.update()
+
+    # presentation
+    def __set_offscreen_display(self) -> None:
+        """
+        Draw on a separate surface, which is copied to the window (after post-processing) when the frame is shown.
+        """
+        if self.__offscreen_display is None:
+            self.__offscreen_display = pg.Surface(self.__screen_size).convert()
+        self.__offscreen_display.blit(self.display, (0, 0))
+        self.display = self.__offscreen_display
+
+    def __can_draw_on_window(self) -> bool:
+        """
+        Check if everything can be drawn straight into the window.
+        Only if DIRECT_PRESENT is on, there is no post-processing & the window is the same size as the game screen
+        (fullscreen window can get the desktop resolution).
+        :return: True/False
+        """
+        return DIRECT_PRESENT and not self.__post_processes and self.window.get_size() == self.__screen_size
+
+    def add_post_process(self, post_process) -> None:
+        """
+        Add a post-processing pass.
+        Drawing switches to an offscreen display only while there are post-processing passes.
+        :param post_process: function that changes the finished frame: post_process(surface)
+        """
+        self.__post_processes.append(post_process)
+        if self.display is self.window:
+            self.__set_offscreen_display()
+        self.__dirty_tracker.invalidate()
+
+    def remove_post_process(self, post_process) -> None:
+        """
+        Remove a post-processing pass.
+        Without post-processing, drawing goes straight into the window again (if possible).
+        :param post_process: post-processing pass to remove
+        """
+        self.__post_processes.remove(post_process)
+        if self.__can_draw_on_window():
+            self.window.blit(self.display, (0, 0))
+            self.display = self.window
+        self.__dirty_tracker.invalidate()
+
+    def __copy_to_window(self, rects: list = None) -> None:
+        """
+        Apply post-processing & copy the drawn frame to the window.
+        Nothing is copied when drawing straight into the window.
+        :param rects: parts of the frame to copy (whole frame if None)
+        """
+        if self.display is self.window:
+            return
+
+        for post_process in self.__post_processes:
+            post_process(self.display)
+
+        if rects is None:
+            self.window.blit(self.display, (0, 0))
+        else:
+            for rect in rects:
+                self.window.blit(self.display, rect, rect)
+
+    def present(self) -> None:
+        """
+        Show the drawn frame (menus).
+        """
+        self.__copy_to_window()
+        pg.display.update()
+
+    def __is_dirty_rects_on(self) -> bool:
+        """
+        Check if only the changed parts of the screen can be redrawn.
+        Only when the world is drawn at full resolution & there is no post-processing (it changes the whole frame).
+        :return: True/False
+        """
+        return DIRTY_RECTS and self.__renderer is None and not self.__post_processes
+
+    def __draw_world(self, sprites) -> None:
+        """
+        Draw the map and sprites.
+        If the display has a clip set, only that area is drawn.
+        :param sprites: sprites to draw (in drawing order)
+        """
+        # lower internal resolution
+        if self.__renderer is not None:
+            self.__draw_world_scaled(sprites)
+            return
+
+        # fill the screen
+        self.display.fill(TILE_COLOR)
+
+        # draw map (chunks inside the camera view)
+        self.__map.draw(self.display, self.__camera)
+
+        # camera offset (applied while making the batches)
+        x, y = self.__camera.get_offset()
+
+        # draw sprites (in one batch)
+        self.display.blits([(sprite.image, (sprite.rect.x + x, sprite.rect.y + y)) for sprite in sprites],
+                           doreturn=False)
+
+        # draw zombie health bars (over the sprites, inside zombie rects)
+        self.display.blits([(sprite.health_bar, (sprite.rect.x + x, sprite.rect.y + y), ((0, 0), sprite.rect.size))
+                            for sprite in sprites if isinstance(sprite, Zombie)], doreturn=False)
+
+    def __draw_world_scaled(self, sprites) -> None:
+        """
+        Draw the map and sprites at the internal render resolution & scale them up to the display.
+        :param sprites: sprites to draw (in drawing order)
+        """
+        renderer = self.__renderer
+
+        # fill the render surface
+        renderer.surface.fill(TILE_COLOR)
+
+        # draw map (chunks are scaled when baked)
+        self.__map.draw(renderer.surface, self.__camera)
+
+        # draw sprites (in one batch)
+        renderer.draw([(sprite.image, sprite.rect) for sprite in sprites], self.__camera)
+
+        # draw zombie health bars (over the sprites, inside zombie rects)
+        renderer.draw([(sprite.health_bar, sprite.rect, pg.Rect((0, 0), sprite.rect.size))
+                       for sprite in sprites if isinstance(sprite, Zombie)], self.__camera)
+
+        # scale up to the display
+        renderer.present(self.display)
+
+    def __draw_hud(self) -> list:
+        """
+        Draw HUD (fps, score, health bar, gun bar & game timer), if turned on in settings.
+        :return: list of rects covered by the HUD
+        """
+        self.__hud.update(self.__get_hud_values())
+        return self.__hud.draw(self.display)
+
+    def __get_hud_values(self) -> dict:
+        """
+        Get values of the HUD widgets that are turned on in settings.
+        :return: widget name -> value
+        """
+        values = {}
+        # fps (& number of culled sprites)
+        if self.__show_fps:
+            values['fps'] = (int(self.__clock.get_fps()), self.culled_sprites if CULL_SPRITES else None)
+        # player score
+        if self.__show_score:
+            values['score'] = self.player.get_score()
+        # player health bar
+        if self.__show_health:
+            values['health'] = self.player.get_health()
+        # gun bar (whole numbers, the bar is drawn in whole pixels)
+        if self.__show_gun_bar:
+            values['gun_bar'] = int(self.player.get_gun_cool_down())
+        # game timer
+        if self.__show_game_timer:
+            values['game_timer'] = self.game_timer.get_seconds()
+        return values
+
+    def __draw_dirty(self, sprites) -> None:
+        """
+        Redraw only the parts of the screen that changed since the last frame & update only those parts.
+        :param sprites: sprites to draw (in drawing order)
+        """
+        sprites = list(sprites)
+        screen_rect = self.display.get_rect()
+        dirty_rects = [rect.clip(screen_rect) for rect in self.__dirty_tracker.get_dirty_rects(sprites, self.__camera)]
+        dirty_rects = [rect for rect in dirty_rects if rect.w and rect.h]
+
+        # redraw the map & sprites under each dirty rect (sprite screen rects are found once per frame)
+        sprite_rects = self.__dirty_tracker.get_screen_rects()
+        for rect in dirty_rects:
+            self.display.set_clip(rect)
+            self.__draw_world([sprites[i] for i in rect.collidelistall(sprite_rects)])
+        self.display.set_clip(None)
+
+        # HUD is drawn every frame
+        hud_rects = self.__draw_hud()
+        self.__dirty_tracker.set_hud_rects(hud_rects)
+
+        # update only the changed parts
+        update_rects = DirtyTracker.merge_rects(dirty_rects + hud_rects)
+        self.__copy_to_window(update_rects)
+        pg.display.update(update_rects)
+
+    def __get_sprites_to_draw(self):
+        """
+        Get sprites to draw.
+        If culling is on, only the sprites inside the camera view are drawn.
+        :return: sprites in drawing order
+        """
+        if not CULL_SPRITES:
+            self.culled_sprites = 0
+            return self.all_sprites
+
+        visible_sprites = self.all_sprites.get_visible(self.__camera.get_view_rect())
+        self.culled_sprites = len(self.all_sprites) - len(visible_sprites)
+        return visible_sprites
+
+    def __update(self) -> None:
+        """
+        Main update function.
+        """
+        self.__check_level()  # check if next level
+        self.all_sprites.update()  # update all sprites
+        self.__camera.update(self.player)  # update the camera to follow player
+
+    def quit_game(self) -> None:
+        """
+        Quit the game.
+        """
+        self.playing = False
+        self.running = False
+        pg.quit()
+        exit()
+
+    def reload_changed_assets(self) -> None:
+        """
+        Reload asset files changed while the game is running (dev mode, HOT_RELOAD in config).
+        Only changed assets & images made from them (scaled, flipped, rotated, masks...) are made again.
+        New pixels are copied into the shared images, so sprites & menus show them without reloading the level.
+        """
+        if self.__asset_watcher is None:
+            return
+
+        for path in self.__asset_watcher.get_changed():
+            try:
+                resized = self.__reload_asset(path)
+            except (pg.error, OSError, ValueError, KeyError) as error:  # file is still being written...
+                self.__asset_watcher.report(path, error=error)
+                continue
+
+            self.__asset_watcher.report(path, resized)
+            self.__dirty_tracker.invalidate()  # images changed in place, redraw everything
+
+    def __reload_asset(self, path: str) -> int:
+        """
+        Reload a changed asset file.
+        Map files (.tmx, .tsx) are loaded again when a level starts.
+        :param path: changed file
+        :return: number of images that changed size (only new sprites get them)
+        """
+        asset_loader.discard(path)  # loaded in background before it changed
+
+        # sounds are decoded again on next use (music is streamed from the file)
+        if path.lower().endswith(('.ogg', '.wav')):
+            sound_registry.discard(path)
+            return 0
+
+        # sprite sheets (animations & effects made from them)
+        resized = 0
+        for sprite_sheet in (self.player_sprite_sheet, self.zombies_sprite_sheet, self.explosion_sprite_sheet):
+            if path in sprite_sheet.get_files():
+                resized += sprite_sheet.reload()
+
+        # images (all sizes & rotations) & effects made from them
+        resized += asset_cache.reload(path)
+        if self.effect_frames is not None:
+            resized += self.effect_frames.reload(path)
+
+        # map tiles
+        if self.__map is not None and path in self.__map.get_image_files():
+            self.__map.reload_images()
+
+        return resized
+
+    def warm_cache(self) -> dict:
+        """
+        Load the sprites of every level, so their processed images are saved in the disk cache.
+        Next time the game starts, images are loaded from the cache (without decoding & processing).
+        :return: disk cache stats
+        """
+        self.__load_level_data()
+        for map_file in (self.__level_1_map, self.__level_2_map, self.__level_3_map):
+            self.__make_groups()
+            self.__make_level_map(TiledMap(map_file))
+            self.__spawn_player()
+            self.__spawn_sprites()
+        return surface_cache.get_stats()
+
+    # ========== LEVEL FUNCTIONS ==========
+    def __level_1(self) -> None:
+        """
+        Load level 1.
+        """
+        # set timer seconds
+        self.game_timer.set_timer(180)
+
+        # load data used by level sprites (first level only)
+        self.__load_level_data()
+
+        # set flags
+        self.__set_flags()
+
+        # create groups
+        self.__make_groups()
+
+        # load the map & make a surface for it
+        self.__make_level_map(TiledMap(self.__level_1_map))
+
+        # spawn player
+        self.__spawn_player()
+
+        # spawn other sprites
+        self.__spawn_sprites()
+
+        # spawn camera
+        self.__camera = Camera(self.__map.width, self.__map.height)
+
+        # play level start sound
+        self.__play_level_start_sound()
+
+    def __level_2(self) -> None:
+        """
+        Load level 2.
+        """
+        # set timer seconds
+        self.game_timer.set_timer(180)
+
+        # get player health & score from previous level
+        health, score = self.__get_player_data()
+
+        # load data used by level sprites (first level only)
+        self.__load_level_data()
+
+        # set flags
+        self.__set_flags()
+
+        # create groups
+        self.__make_groups()
+
+        # load the map & make a surface for it
+        self.__make_level_map(TiledMap(self.__level_2_map))
+
+        # spawn player
+        self.__spawn_player()
+
+        # set (keep) player's health & score
+        self.__keep_player_data(health, score)
+
+        # spawn other sprites
+        self.__spawn_sprites()
+
+        # spawn camera
+        self.__camera = Camera(self.__map.width, self.__map.height)
+
+        # play level start sound
+        self.__play_level_start_sound()
+
+    def __level_3(self) -> None:
+        """
+        Load level 3.
+        """
+        # Set timer seconds
+        self.game_timer.set_timer(180)
+
+        # get player health & score from previous level
+        health, score = self.__get_player_data()
+
+        # load data used by level sprites (first level only)
+        self.__load_level_data()
+
+        # set flags
+        self.__set_flags()
+
+        # create groups
+        self.__make_groups()
+
+        # load the map & make a surface for it
+        self.__make_level_map(TiledMap(self.__level_3_map))
+
+        # spawn player
+        self.__spawn_player()
+
+        # set (keep) player's health & score
+        self.__keep_player_data(health, score)
+
+        # spawn other sprites
+        self.__spawn_sprites()
+
+        # spawn camera
+        self.__camera = Camera(self.__map.width, self.__map.height)
+
+        # play level start sound
+        self.__play_level_start_sound()
+
+    def __load_level_data(self) -> None:
+        """
+        Load data used by level sprites (effect frames).
+        Loaded only once, sprite sheets keep loading in background while the menu is shown.
+        """
+        if self.effect_frames is None:
+            self.effect_frames = EffectFrames(self)
+
+    def __spawn_player(self) -> None:
+        """
+        Spawn player.
+        Spawned separately from other objects to keep health & score in next levels.
+        """
+        for tile_object in self.__map.tmx_data.objects:
+            object_center = vec(tile_object.x + tile_object.width / 2, tile_object.y + tile_object.height / 2)
+
+            if tile_object.name == 'player':
+                self.player = Player(self, object_center.x, object_center.y)
+
+    def __get_player_data(self):
+        """
+        Get player's data (to keep in next levels).
+        :return: player health & score
+        """
+        health = self.player.get_health()
+        score = self.player.get_score()
+        return health, score
+
+    def __keep_player_data(self, health: int, score: int) -> None:
+        """
+        Keep player's data from previous levels.
+        :param health: player health
+        :param score: player score
+        """
+        self.player.keep_health(health)
+        self.player.keep_score(score)
+
+    def __set_flags(self) -> None:
+        """
+        Set flags (including settings flags) when starting a new level.
+        Fixes certain bugs.
+        """
+        self.level_up = False
+        self.culled_sprites = 0  # number of sprites outside the camera view (not drawn)
+        self.click = False  # prevent accidental clicks after game over
+        self.game_over = False  # fix game over bug after clicking new game
+        self.time_up = False  # fix bug where 'Time is up' shows every time
+
+        self.__set_settings_flags()
+
+        self.main_menu.burn_sound.stop()  # fix sound bug
+
+    def __set_settings_flags(self) -> None:
+        """
+        Set flags from the settings (HUD widgets & internal render resolution).
+        Renderer is made again only when the resolution changes.
+        """
+        # settings flags (True if turned on in settings)
+        self.__show_fps = self.main_menu.fps_on
+        self.__show_score = self.main_menu.score_on
+        self.__show_health = self.main_menu.health_on
+        self.__show_gun_bar = self.main_menu.gun_bar_on
+        self.__show_game_timer = self.main_menu.game_timer_on
+
+        # internal render resolution (world is scaled up to the display, HUD & menus are drawn at full resolution)
+        resolution = self.main_menu.render_resolution
+        renderer = self.__renderer
+        if resolution == self.__screen_size:
+            renderer = None
+        elif renderer is None or renderer.resolution != resolution:
+            renderer = ScaledRenderer(resolution)
+
+        if renderer is not self.__renderer:
+            self.__renderer = renderer
+            if self.__map is not None:
+                self.__map.set_scale(renderer.scale if renderer is not None else 1)  # re-bake chunks at the new scale
+            self.__dirty_tracker.invalidate()  # redraw everything
+
+    def apply_settings(self) -> None:
+        """
+        Apply changed settings right away (no restart needed), called when settings are saved.
+        Only what uses the settings is updated: controls, HUD flags & render resolution,
+        player's controls & sounds settings and bullets damage (gun upgrade).
+        """
+        self.main_menu.apply_controls()
+        self.__set_settings_flags()
+
+        if self.player is not None:
+            self.player.apply_settings()
+            for bullet in self.bullets:
+                bullet.apply_settings()
+
+    def __make_groups(self) -> None:
+        """
+        Create sprite groups.
+        """
+        self.all_sprites = SpatialLayeredUpdates()
+        self.zombies = pg.sprite.Group()
+        self.obstacles = pg.sprite.Group()
+        self.bullets = pg.sprite.Group()
+        self.laser_receivers = pg.sprite.Group()
+        self.items = pg.sprite.Group()
+        self.doors = pg.sprite.Group()
+        self.acid = pg.sprite.Group()
+        self.spikes = pg.sprite.Group()
+        self.saws = pg.sprite.Group()
+        self.laser_machines = pg.sprite.Group()
+        self.lasers = pg.sprite.Group()
+        self.levers = pg.sprite.Group()
+
+    def __make_level_map(self, map_file: TiledMap) -> None:
+        """
+        Make a map.
+        Map surface is baked in chunks, when they come near the camera view.
+        :param map_file: level map file
+        """
+        self.__map = map_file
+        if self.__renderer is not None:
+            self.__map.set_scale(self.__renderer.scale)  # bake chunks at the internal render resolution
+        self.__dirty_tracker.invalidate()  # new map, redraw everything
+
+    def __spawn_sprites(self) -> None:
+        """
+        Spawn sprites from tmx map (zombies, tiles, objects...).
+        """
+        for tile_object in self.__map.tmx_data.objects:
+            x_pos = tile_object.x
+            y_pos = tile_object.y
+            width = tile_object.width
+            height = tile_object.height
+            object_type = tile_object.type
+            object_center = vec(x_pos + width / 2, y_pos + height / 2)
+
+            # obstacles - ground, screen limits and zombie boundaries
+            if tile_object.name == 'obstacle':
+                Obstacle(self, x_pos, y_pos, width, height, object_type)
+
+            # zombies
+            if tile_object.name == 'zombie':
+                Zombie(self, object_center.x, object_center.y)
+
+            # hazards
+            if tile_object.name == 'acid':
+                Acid(self, x_pos, y_pos, width, height)
+            if tile_object.name == 'spikes':
+                Spikes(self, x_pos, y_pos, width, height)
+            if tile_object.name == 'saw':
+                Saw(self, x_pos, y_pos, width, height, object_type)
+            if tile_object.name == 'laser_machine':
+                LaserMachine(self, x_pos, y_pos, width, height, object_type)
+            if tile_object.name == 'laser_beam':
+                LaserBeam(self, x_pos, y_pos, width, height, object_type)
+            if tile_object.name == 'laser_receiver':
+                LaserReceiver(self, x_pos, y_pos, width, height, object_type)
+
+            # interactive sprites
+            if tile_object.name == 'door':
+                Door(self, x_pos, y_pos, width, height, object_type)
+            if tile_object.name == 'door_switch':
+                DoorSwitch(self, x_pos, y_pos, width, height)
+            if tile_object.name == 'lever':
+                Lever(self, x_pos, y_pos, width, height, object_type)
+
+            # collectible items
+            if tile_object.name in ('health', 'coin', 'key'):
+                Item(self, object_center, tile_object.name)
+
+    def __check_level(self) -> None:
+        """
+        Check if next level and change.
+        """
+        # changing levels
+        if self.level_up:
+            self.level += 1
+            if self.level == 2:
+                self.__level_2()
+            elif self.level == 3:
+                self.__level_3()
+            else:
+                self.__game_over_menu.set_game_completed()
+
+    def __play_level_start_sound(self) -> None:
+        """
+        Play the level start sound.
+        """
+        if self.main_menu.level_start_sound_on:
+            self.__channel1.play(self.main_menu.level_start_sound.get_sound(), loops=0)
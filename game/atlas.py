@@ -0,0 +1,225 @@
+from . import pg
+from .config import IMAGES_DIR, ATLAS_DIR, ATLAS_SIZE, ATLAS_PADDING
+from .loader import asset_loader
+from os import makedirs, walk, remove
+from os.path import join, getmtime, relpath
+from glob import glob
+import json
+
+
+class TextureAtlas:
+    """
+    Single atlas image with its .json index (same format as the sprite sheets).
+    Atlas image is decoded only once (on first use), images are given as subsurfaces of it.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Load the atlas index (image is loaded on first use).
+        :param filename: atlas image file (.png), index file has the same name (.json)
+        """
+        self.__filename = filename
+        self.__image = None
+
+        with open(filename.replace('.png', '.json')) as f:
+            self.__frames = json.load(f)['frames']
+
+        self.__subsurfaces = {}  # name -> image
+
+    def __contains__(self, name: str) -> bool:
+        """
+        Check if the image is in the atlas.
+        :param name: image name (path relative to the images directory)
+        :return: True if the image is in the atlas
+        """
+        return name in self.__frames
+
+    def get_names(self) -> list:
+        """
+        Get names of all images in the atlas.
+        :return: list of image names
+        """
+        return list(self.__frames)
+
+    def get_mtime(self, name: str) -> int:
+        """
+        Get modification time the image file had when the atlas was built.
+        :param name: image name
+        :return: modification time (seconds)
+        """
+        return self.__frames[name]['sourceMtime']
+
+    def get(self, name: str) -> pg.Surface:
+        """
+        Get image from the atlas.
+        Image shares pixels with the atlas, so it must not be changed.
+        :param name: image name
+        :return: image (subsurface of the atlas)
+        """
+        image = self.__subsurfaces.get(name)
+        if image is None:
+            if self.__image is None:
+                self.__image = asset_loader.get_image(self.__filename).convert_alpha()  # decoded once (in background)
+
+            frame = self.__frames[name]['frame']
+            image = self.__image.subsurface((frame['x'], frame['y'], frame['w'], frame['h']))
+            self.__subsurfaces[name] = image
+        return image
+
+
+class AtlasLoader:
+    """
+    Finds image files in the built texture atlases.
+    Images that are not in any atlas (or changed after the atlas was built) are not found.
+    """
+
+    def __init__(self, directory: str = ATLAS_DIR):
+        """
+        Make the loader (atlases are found on first use).
+        :param directory: directory with atlases
+        """
+        self.__directory = directory
+        self.__atlases = None  # image name -> atlas
+
+    def __get_atlases(self) -> dict:
+        """
+        Load indexes of all atlases in the directory (only once).
+        :return: image name -> atlas
+        """
+        if self.__atlases is None:
+            self.__atlases = {}
+            for filename in sorted(glob(join(self.__directory, 'atlas_*.png'))):
+                atlas = TextureAtlas(filename)
+                for name in atlas.get_names():
+                    self.__atlases[name] = atlas
+        return self.__atlases
+
+    def get(self, path: str):
+        """
+        Get image from the atlases.
+        :param path: image file
+        :return: image (subsurface of the atlas) or None if the image is not in the atlases
+        """
+        name = get_image_name(path)
+        atlas = self.__get_atlases().get(name)
+
+        # not in atlases, or changed after the atlases were built
+        if atlas is None or atlas.get_mtime(name) != int(getmtime(path)):
+            return None
+        return atlas.get(name)
+
+    def reset(self) -> None:
+        """
+        Forget loaded atlases (they're loaded again on next use).
+        """
+        self.__atlases = None
+
+
+def get_image_name(path: str, images_dir: str = IMAGES_DIR) -> str:
+    """
+    Get image name used in the atlases.
+    :param path: image file
+    :param images_dir: directory with images
+    :return: path relative to the images directory (with "/")
+    """
+    return relpath(path, images_dir).replace('\\', '/')
+
+
+def _find_images(directory: str) -> list:
+    """
+    Find all .png images in the directory (& its subdirectories).
+    :param directory: directory to search
+    :return: sorted list of image files
+    """
+    images = []
+    for root, _, files in walk(directory):
+        images.extend(join(root, file) for file in files if file.lower().endswith('.png'))
+    return sorted(images)
+
+
+def _pack(sizes: dict, max_size: int, padding: int) -> list:
+    """
+    Place images on atlas pages (rows of images, tallest images first).
+    :param sizes: image name -> (width, height)
+    :param max_size: max page width & height
+    :param padding: space between images
+    :return: list of pages: (page size, {image name: (x, y)})
+    """
+    pages = []
+    positions = {}
+    x = y = row_height = page_width = 0
+
+    for name in sorted(sizes, key=lambda n: (sizes[n][1], sizes[n][0]), reverse=True):
+        width, height = sizes[name]
+
+        # next row
+        if x and x + width > max_size:
+            x = 0
+            y += row_height + padding
+            row_height = 0
+
+        # next page
+        if y and y + height > max_size:
+            pages.append(((page_width, y - padding), positions))
+            positions = {}
+            x = y = row_height = page_width = 0
+
+        positions[name] = (x, y)
+        x += width + padding
+        row_height = max(row_height, height)
+        page_width = max(page_width, x - padding)
+
+    if positions:
+        pages.append(((page_width, y + row_height), positions))
+    return pages
+
+
+def build_atlases(images_dir: str = IMAGES_DIR, atlas_dir: str = ATLAS_DIR, max_size: int = ATLAS_SIZE,
+                  padding: int = ATLAS_PADDING) -> list:
+    """
+    Pack all images into texture atlases (atlas_0.png, atlas_1.png...) with .json indexes.
+    Old atlases in the directory are replaced.
+    :param images_dir: directory with images
+    :param atlas_dir: directory to save the atlases to
+    :param max_size: max atlas width & height
+    :param padding: space between images
+    :return: list of saved atlas files
+    """
+    files = {get_image_name(path, images_dir): path for path in _find_images(images_dir)}
+    images = {name: pg.image.load(path) for name, path in files.items()}
+
+    makedirs(atlas_dir, exist_ok=True)
+    for filename in glob(join(atlas_dir, 'atlas_*.*')):
+        remove(filename)
+
+    saved = []
+    pages = _pack({name: image.get_size() for name, image in images.items()}, max_size, padding)
+    for i, (size, positions) in enumerate(pages):
+        atlas = pg.Surface(size, pg.SRCALPHA, 32)
+        frames = {}
+        for name, (x, y) in positions.items():
+            image = images[name]
+            width, height = image.get_size()
+            atlas.blit(image, (x, y))  # transparent atlas, pixels are copied as they are
+            frames[name] = {
+                'frame': {'x': x, 'y': y, 'w': width, 'h': height},
+                'rotated': False,
+                'trimmed': False,
+                'spriteSourceSize': {'x': 0, 'y': 0, 'w': width, 'h': height},
+                'sourceSize': {'w': width, 'h': height},
+                'sourceMtime': int(getmtime(files[name])),
+            }
+
+        filename = join(atlas_dir, f'atlas_{i}.png')
+        pg.image.save(atlas, filename)
+        with open(filename.replace('.png', '.json'), 'w') as f:
+            json.dump({'frames': frames, 'meta': {'image': f'atlas_{i}.png', 'size': {'w': size[0], 'h': size[1]}}},
+                      f, indent=4)
+        saved.append(filename)
+
+    return saved
+
+
+if __name__ == '__main__':
+    for atlas_file in build_atlases():
+        print(f'saved {atlas_file}')
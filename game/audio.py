@@ -0,0 +1,236 @@
+from . import pg
+from .config import SOUND_MEMORY
+from .loader import asset_loader
+from collections import OrderedDict
+from os.path import normpath
+
+
+def get_mixer_volume(volume: float) -> float:
+    """
+    Get volume the way the mixer keeps it (128 steps, rounded down).
+    :param volume: volume (0.0 - 1.0)
+    :return: mixer volume
+    """
+    return max(0, min(int(volume * 128), 128)) / 128
+
+
+class SoundRegistry:
+    """
+    Decoded sound effects, each decoded on first use.
+    When decoded sounds take more memory than the budget, the least recently used ones (that are not playing)
+    are dropped & decoded again on next use.
+    """
+
+    def __init__(self, memory: int = SOUND_MEMORY):
+        """
+        Make an empty registry.
+        :param memory: memory budget for decoded sounds (bytes)
+        """
+        self.__memory = memory
+        self.__sounds = OrderedDict()  # file (normalized path) -> decoded sound (least recently used first)
+        self.__sizes = {}  # file -> decoded size (bytes)
+        self.__used = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def get(self, path: str) -> pg.mixer.Sound:
+        """
+        Get decoded sound (decoded if it's not in the registry).
+        :param path: sound file
+        :return: sound
+        """
+        key = normpath(path)
+        sound = self.__sounds.get(key)
+        if sound is not None:
+            self.__sounds.move_to_end(key)
+            return sound
+
+        sound = asset_loader.get_sound(path)  # already decoded if loaded in background
+        self.loads += 1
+        self.__sounds[key] = sound
+        self.__sizes[key] = SoundRegistry.__get_size(sound)
+        self.__used += self.__sizes[key]
+        self.__evict()
+        return sound
+
+    def peek(self, path: str):
+        """
+        Get sound only if it's decoded (doesn't decode it).
+        :param path: sound file
+        :return: sound or None
+        """
+        return self.__sounds.get(normpath(path))
+
+    @staticmethod
+    def __get_size(sound: pg.mixer.Sound) -> int:
+        """
+        Get memory used by decoded sound.
+        :param sound: sound
+        :return: size in bytes
+        """
+        frequency, size, channels = pg.mixer.get_init()
+        return int(sound.get_length() * frequency) * channels * abs(size) // 8
+
+    def __evict(self) -> None:
+        """
+        Drop least recently used sounds until they fit in the memory budget.
+        Sounds that are playing & the last used sound are kept.
+        """
+        for path in list(self.__sounds)[:-1]:
+            if self.__used <= self.__memory:
+                break
+            if self.__sounds[path].get_num_channels():  # playing
+                continue
+
+            del self.__sounds[path]
+            self.__used -= self.__sizes.pop(path)
+            self.evictions += 1
+
+    def discard(self, path: str) -> None:
+        """
+        Drop decoded sound (it's decoded again on next use), used when the sound file changes.
+        :param path: sound file
+        """
+        key = normpath(path)
+        if self.__sounds.pop(key, None) is not None:
+            self.__used -= self.__sizes.pop(key)
+
+    def get_stats(self) -> dict:
+        """
+        Get registry stats.
+        :return: dict with number of decoded sounds, memory (bytes), loads & evictions
+        """
+        return {
+            'sounds': len(self.__sounds),
+            'memory': self.__used,
+            'loads': self.loads,
+            'evictions': self.evictions,
+        }
+
+
+# shared by all sound effects
+sound_registry = SoundRegistry()
+
+
+class LazySound:
+    """
+    Sound effect decoded on first use (through the sound registry).
+    Used like pg.mixer.Sound, the volume is kept even when the decoded sound is dropped.
+    """
+
+    def __init__(self, path: str):
+        """
+        Make the sound (not decoded yet).
+        :param path: sound file
+        """
+        self.__path = path
+        self.__volume = 1.0
+
+    def get_sound(self) -> pg.mixer.Sound:
+        """
+        Get decoded sound (decoded if needed), with the volume set.
+        :return: sound
+        """
+        sound = sound_registry.get(self.__path)
+        if sound.get_volume() != self.__volume:
+            sound.set_volume(self.__volume)
+        return sound
+
+    def play(self, loops: int = 0):
+        """
+        Play the sound.
+        :param loops: number of repeats (-1 - forever)
+        :return: channel the sound plays on (or None)
+        """
+        return self.get_sound().play(loops)
+
+    def stop(self) -> None:
+        """
+        Stop the sound (if it's decoded, it can't be playing otherwise).
+        """
+        sound = sound_registry.peek(self.__path)
+        if sound is not None:
+            sound.stop()
+
+    def set_volume(self, volume: float) -> None:
+        """
+        Set sound volume.
+        :param volume: volume (0.0 - 1.0)
+        """
+        self.__volume = get_mixer_volume(volume)
+        sound = sound_registry.peek(self.__path)
+        if sound is not None:
+            sound.set_volume(self.__volume)
+
+    def get_volume(self) -> float:
+        """
+        Get sound volume.
+        :return: volume (0.0 - 1.0)
+        """
+        return self.__volume
+
+    def get_num_channels(self) -> int:
+        """
+        Get number of channels the sound is playing on.
+        :return: number of channels
+        """
+        sound = sound_registry.peek(self.__path)
+        return sound.get_num_channels() if sound is not None else 0
+
+
+class MusicTrack:
+    """
+    Long music track, streamed from the file with pg.mixer.music (not decoded in memory).
+    Used like pg.mixer.Sound, only one track plays at a time.
+    """
+
+    __playing = None  # track loaded in pg.mixer.music
+
+    def __init__(self, path: str, volume: float = 1.0):
+        """
+        Make the track.
+        :param path: music file
+        :param volume: volume (0.0 - 1.0)
+        """
+        self.__path = path
+        self.__volume = get_mixer_volume(volume)
+
+    def play(self, loops: int = 0) -> None:
+        """
+        Play the track (stops the track that's playing).
+        :param loops: number of repeats (-1 - forever)
+        """
+        pg.mixer.music.load(self.__path)
+        pg.mixer.music.set_volume(self.__volume)
+        pg.mixer.music.play(loops)
+        MusicTrack.__playing = self
+
+    def stop(self) -> None:
+        """
+        Stop the track (if it's playing).
+        """
+        if MusicTrack.__playing is self:
+            pg.mixer.music.stop()
+
+    def set_volume(self, volume: float) -> None:
+        """
+        Set track volume.
+        :param volume: volume (0.0 - 1.0)
+        """
+        self.__volume = get_mixer_volume(volume)
+        if MusicTrack.__playing is self:
+            pg.mixer.music.set_volume(self.__volume)
+
+    def get_volume(self) -> float:
+        """
+        Get track volume.
+        :return: volume (0.0 - 1.0)
+        """
+        return self.__volume
+
+    def get_num_channels(self) -> int:
+        """
+        Get number of channels the track is playing on (like pg.mixer.Sound).
+        :return: 1 if the track is playing, otherwise 0
+        """
+        return 1 if MusicTrack.__playing is self and pg.mixer.music.get_busy() else 0
@@ -1,5 +1,7 @@
 from . import pg
 from .config import WIDTH, HEIGHT, FONT, WHITE, RED
+from .cache import asset_cache
+from .fonts import font_registry
 from .images import VOLUME_INDICATOR_IMAGE, VOLUME_DOWN_IMG, VOLUME_DOWN_HOVER_IMG, \
     VOLUME_UP_IMG, VOLUME_UP_HOVER_IMG, SWITCH_ON_HOVER_IMG, SWITCH_ON_IMG, SWITCH_OFF_HOVER_IMG, SWITCH_OFF_IMG, \
     MUTE_IMG, MUTE_HOVER_IMG, UN_MUTE_IMG, UN_MUTE_HOVER_IMG, ERROR_IMG
@@ -42,60 +44,79 @@ class TextButton(Button):
         # button text, text size & text font
         self.__text = text
         self.__size = size
-        self.__font = pg.font.Font(FONT, self.__size)
+        self.__font = font_registry.get(FONT, self.__size)  # shared by all buttons with the same size
 
         # shadow effect
         self.__shadow_x = self.x + 1
         self.__shadow_y = self.y + 1
 
+        self.__set_text_surfaces()
         self.__set_rect()
 
+    def set_text(self, text: str) -> None:
+        """
+        Change button text (rendered again only if it's different).
+        :param text: button text
+        """
+        if text != self.__text:
+            self.__text = text
+            self.__set_text_surfaces()
+            self.__set_rect()
+
     def __set_rect(self) -> None:
         """
         Set text rect for shadow & main text.
         Text shadow rect is set first because it's drawn below.
         Main text rect is set second because it's drawn on top of shadow.
         """
-        self.__set_text_surfaces()
+        shadow_text_surface, main_text_surface = self.__text_surfaces[False]
 
         # shadow text rect
-        self.__shadow_rect = self.__shadow_text_surface.get_rect()
+        self.__shadow_rect = shadow_text_surface.get_rect()
         self.__shadow_rect.center = (self.__shadow_x, self.__shadow_y)
 
         # main text rect
-        self.rect = self.__main_text_surface.get_rect()
+        self.rect = main_text_surface.get_rect()
         self.rect.center = (self.x, self.y)
 
     def __set_text_surfaces(self) -> None:
         """
-        Render text surfaces for shadow & main text.
+        Render text surfaces for shadow & main text, for both normal & hovered button (once).
         Shadow is drawn first because it's below the main text.
         Otherwise it would be inverted.
         """
-        # shadow text surface (below)
-        self.__shadow_text_surface = self.__font.render(self.__text, True, self.__get_shadow_color())
+        self.__text_surfaces = {}
+        for hovered in (False, True):
+            # shadow text surface (below)
+            shadow_text_surface = self.__font.render(self.__text, True, TextButton.__get_shadow_color(hovered))
+
+            # main text surface (above)
+            main_text_surface = self.__font.render(self.__text, True, TextButton.__get_main_color(hovered))
 
-        # main text surface (above)
-        self.__main_text_surface = self.__font.render(self.__text, True, self.__get_main_color())
+            self.__text_surfaces[hovered] = (shadow_text_surface, main_text_surface)
 
-    def __get_shadow_color(self) -> tuple:
+    @staticmethod
+    def __get_shadow_color(hovered: bool) -> tuple:
         """
         Get text shadow color.
         Text shadow is drawn below the main text.
+        :param hovered: hovering the button
         :return: color tuple
         """
-        if self.hovered:
+        if hovered:
             return WHITE
         else:
             return RED
 
-    def __get_main_color(self) -> tuple:
+    @staticmethod
+    def __get_main_color(hovered: bool) -> tuple:
         """
         Get main text color.
         Main text is drawn above the shadow.
+        :param hovered: hovering the button
         :return: color tuple
         """
-        if self.hovered:
+        if hovered:
             return RED
         else:
             return WHITE
@@ -106,11 +127,11 @@ class TextButton(Button):
         Draw the shadow first, then the main text.
         :param surface: surface to draw on (game display)
         """
-        self.__set_text_surfaces()
+        shadow_text_surface, main_text_surface = self.__text_surfaces[bool(self.hovered)]
 
         # draw the shadow & text
-        surface.blit(self.__shadow_text_surface, self.__shadow_rect)
-        surface.blit(self.__main_text_surface, self.rect)
+        surface.blit(shadow_text_surface, self.__shadow_rect)
+        surface.blit(main_text_surface, self.rect)
 
 
 class VolumeIndicator:
@@ -137,7 +158,7 @@ class VolumeIndicator:
         self.__center_x = (vol_down_btn.rect.centerx + vol_up_btn.rect.centerx) / 2
         self.__center_y = vol_up_btn.rect.centery  # can use any button (center y is the same)
 
-        self.__image = pg.image.load(VOLUME_INDICATOR_IMAGE).convert_alpha()
+        self.__image = asset_cache.load(VOLUME_INDICATOR_IMAGE)
         self.__rect = self.__image.get_rect(center=(self.__set_x_position(), self.__center_y))
 
     def __set_x_position(self) -> float:
@@ -212,20 +233,20 @@ class VolumeControl(Button):
         """
         Load & set images based on the button type.
         """
-        load_img = pg.image.load
+        load_img = asset_cache.load
 
         # down
         if self.__type == 'down':
-            self.__image_normal = load_img(VOLUME_DOWN_IMG).convert_alpha()
-            self.__image_hover = load_img(VOLUME_DOWN_HOVER_IMG).convert_alpha()
+            self.__image_normal = load_img(VOLUME_DOWN_IMG)
+            self.__image_hover = load_img(VOLUME_DOWN_HOVER_IMG)
         # up
         elif self.__type == 'up':
-            self.__image_normal = load_img(VOLUME_UP_IMG).convert_alpha()
-            self.__image_hover = load_img(VOLUME_UP_HOVER_IMG).convert_alpha()
+            self.__image_normal = load_img(VOLUME_UP_IMG)
+            self.__image_hover = load_img(VOLUME_UP_HOVER_IMG)
         # otherwise (error)
         else:
-            self.__image_normal = load_img(ERROR_IMG).convert_alpha()
-            self.__image_hover = load_img(ERROR_IMG).convert_alpha()
+            self.__image_normal = load_img(ERROR_IMG)
+            self.__image_hover = load_img(ERROR_IMG)
 
         self.__image = self.__image_normal
         self.rect = self.__image.get_rect()
@@ -358,15 +379,15 @@ class OnOffSwitch(Button):
         """
         Load switch images.
         """
-        load_img = pg.image.load
+        load_img = asset_cache.load
 
         # on
-        self.__on_img = load_img(SWITCH_ON_IMG).convert_alpha()
-        self.__on_hover_img = load_img(SWITCH_ON_HOVER_IMG).convert_alpha()
+        self.__on_img = load_img(SWITCH_ON_IMG)
+        self.__on_hover_img = load_img(SWITCH_ON_HOVER_IMG)
 
         # off
-        self.__off_img = load_img(SWITCH_OFF_IMG).convert_alpha()
-        self.__off_hover_img = load_img(SWITCH_OFF_HOVER_IMG).convert_alpha()
+        self.__off_img = load_img(SWITCH_OFF_IMG)
+        self.__off_hover_img = load_img(SWITCH_OFF_HOVER_IMG)
 
     def __get_image(self) -> pg.Surface:
         """
@@ -428,15 +449,15 @@ class MuteToggle(Button):
         """
         Load mute toggle images.
         """
-        load_img = pg.image.load
+        load_img = asset_cache.load
 
         # mute images
-        self.__mute_normal = load_img(MUTE_IMG).convert_alpha()
-        self.__mute_hover = load_img(MUTE_HOVER_IMG).convert_alpha()
+        self.__mute_normal = load_img(MUTE_IMG)
+        self.__mute_hover = load_img(MUTE_HOVER_IMG)
 
         # un-mute images
-        self.__un_mute_normal = load_img(UN_MUTE_IMG).convert_alpha()
-        self.__un_mute_hover = load_img(UN_MUTE_HOVER_IMG).convert_alpha()
+        self.__un_mute_normal = load_img(UN_MUTE_IMG)
+        self.__un_mute_hover = load_img(UN_MUTE_HOVER_IMG)
 
     def __set_image(self) -> None:
         """
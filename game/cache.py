@@ -0,0 +1,326 @@
+from . import pg
+from .config import USE_ATLAS
+from .atlas import AtlasLoader
+from .surface_cache import surface_cache
+from .loader import asset_loader
+from os.path import normpath
+from weakref import WeakKeyDictionary
+
+# collision masks of shared images (dropped when the image is not used any more)
+_masks = WeakKeyDictionary()
+
+
+def get_mask(image: pg.Surface) -> pg.mask.Mask:
+    """
+    Get collision mask of an image (made only once for every image).
+    Images are shared, so sprites using the same image (or animation frame) share the mask too.
+    :param image: image
+    :return: mask
+    """
+    mask = _masks.get(image)
+    if mask is None:
+        mask = pg.mask.from_surface(image)
+        _masks[image] = mask
+    return mask
+
+
+def replace_image(image: pg.Surface, new_image: pg.Surface) -> bool:
+    """
+    Copy pixels of a new image into a shared image (its collision mask is made again too).
+    Everyone using the shared image (sprites, animations, buttons...) shows the new pixels.
+    :param image: shared image
+    :param new_image: new image
+    :return: True if replaced, False if the size is different (image can't be changed in place)
+    """
+    if new_image is image:
+        return True
+    if new_image.get_size() != image.get_size():
+        return False
+
+    # copy pixels as they are (without colorkey & blending)
+    colorkey = new_image.get_colorkey()
+    new_image.set_colorkey(None)
+    if image.get_flags() & pg.SRCALPHA:
+        image.fill((0, 0, 0, 0))
+        image.blit(new_image, (0, 0), special_flags=pg.BLEND_RGBA_ADD)
+    else:
+        image.blit(new_image, (0, 0))
+    new_image.set_colorkey(colorkey)
+    image.set_colorkey(colorkey)
+
+    mask = _masks.get(image)
+    if mask is not None:
+        mask.clear()
+        mask.draw(pg.mask.from_surface(image), (0, 0))
+    return True
+
+
+class RotationFrames:
+    """
+    Frames of a rotating image (one frame every "step" degrees).
+    Frames are made only when they're used (lazily) & can be kept in the disk cache.
+    """
+
+    def __init__(self, image: pg.Surface, step: int, source: str = None, params: tuple = ()):
+        """
+        Make rotation frames.
+        :param image: image to rotate
+        :param step: degrees between frames
+        :param source: image file, frames are kept in the disk cache if given
+        :param params: image processing parameters (size, colorkey...), for the disk cache
+        """
+        self.__image = image
+        self.__step = step
+        self.__source = source
+        self.__params = params
+        self.__frames = [None] * (360 // step)
+        self.__masks = [None] * (360 // step)
+
+    def __getitem__(self, index: int) -> pg.Surface:
+        """
+        Get frame (made on first use).
+        :param index: frame number (angle = index * step)
+        :return: rotated image
+        """
+        frame = self.__frames[index]
+        if frame is None:
+            frame = self.__load_frame(index)
+            self.__frames[index] = frame
+            self.__masks[index] = get_mask(frame)
+        return frame
+
+    def get_mask(self, index: int) -> pg.mask.Mask:
+        """
+        Get collision mask of a frame (made with the frame).
+        :param index: frame number
+        :return: mask
+        """
+        if self.__frames[index] is None:
+            self.__getitem__(index)  # mask is made with the frame
+        return self.__masks[index]
+
+    def __len__(self) -> int:
+        """
+        Get number of frames (full circle).
+        :return: number of frames
+        """
+        return len(self.__frames)
+
+    def __load_frame(self, index: int) -> pg.Surface:
+        """
+        Make a frame, or load it from the disk cache (if the source is given).
+        :param index: frame number
+        :return: rotated image
+        """
+        angle = index * self.__step
+
+        def make() -> list:
+            return [pg.transform.rotozoom(self.__image, angle, 1)]  # prevent rotating the background
+
+        if self.__source is None:
+            return make()[0]
+        return surface_cache.get([self.__source], ('rotation', self.__params, angle), make)[0]
+
+    def reload(self, image: pg.Surface) -> None:
+        """
+        Make the made frames again from a changed image (frames & their masks are changed in place).
+        :param image: changed image
+        """
+        self.__image = image
+        for index, frame in enumerate(self.__frames):
+            if frame is not None:
+                new_frame = self.__load_frame(index)
+                if not replace_image(frame, new_frame):
+                    self.__frames[index] = new_frame
+                    self.__masks[index] = get_mask(new_frame)
+
+    def get_made(self) -> list:
+        """
+        Get frames that are made.
+        :return: list of frames
+        """
+        return [frame for frame in self.__frames if frame is not None]
+
+
+class AssetCache:
+    """
+    Process-wide cache of loaded images.
+    Each image is loaded (decoded, scaled & converted) only once & the same surface is given to every sprite.
+    Images are taken from the texture atlases when they're built (see atlas.py), otherwise from separate files.
+    Surfaces from the cache are shared, so they must not be changed (drawn on, filled...).
+    """
+
+    def __init__(self):
+        """
+        Make an empty cache.
+        """
+        self.__images = {}  # (path, size, flags) -> surface
+        self.__rotations = {}  # (path, size, step, colorkey) -> rotation frames
+        self.__atlases = AtlasLoader() if USE_ATLAS else None
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: str, size: tuple = None, alpha: bool = True, angle: int = 0,
+             colorkey: tuple = None) -> pg.Surface:
+        """
+        Get an image.
+        Image is loaded only if it's not in the cache.
+        :param path: image file
+        :param size: size to scale the image to (None - original size)
+        :param alpha: convert with per pixel alpha (convert_alpha) or without (convert)
+        :param angle: rotation angle (degrees), after scaling
+        :param colorkey: transparent color
+        :return: shared image
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        key = (path, size, (alpha, angle, colorkey))
+
+        image = self.__images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = self.__load_image(path, size, alpha, angle, colorkey)
+        self.__images[key] = image
+        return image
+
+    def __load_image(self, path: str, size: tuple, alpha: bool, angle: int, colorkey: tuple) -> pg.Surface:
+        """
+        Load, scale, rotate & convert an image.
+        :param path: image file
+        :param size: size to scale the image to (None - original size)
+        :param alpha: convert with per pixel alpha or without
+        :param angle: rotation angle (degrees)
+        :param colorkey: transparent color
+        :return: image
+        """
+        # scaled/rotated images are kept in the disk cache (loaded without processing next time)
+        if size is not None or angle:
+            def make() -> list:
+                return [self.__process_image(path, size, alpha, angle, colorkey)]
+
+            return surface_cache.get([path], ('image', size, alpha, angle, colorkey), make)[0]
+        return self.__process_image(path, size, alpha, angle, colorkey)
+
+    def __process_image(self, path: str, size: tuple, alpha: bool, angle: int, colorkey: tuple) -> pg.Surface:
+        """
+        Load (from atlas or file), scale, rotate & convert an image.
+        :param path: image file
+        :param size: size to scale the image to (None - original size)
+        :param alpha: convert with per pixel alpha or without
+        :param angle: rotation angle (degrees)
+        :param colorkey: transparent color
+        :return: image
+        """
+        image = self.__atlases.get(path) if self.__atlases is not None else None
+        if image is not None:
+            # atlas images are already converted with per pixel alpha
+            if not alpha:
+                image = image.convert()
+        else:
+            image = asset_loader.get_image(path)  # from the asset pack (if it's built) or the file
+            image = image.convert_alpha() if alpha else image.convert()
+
+        if size is not None:
+            image = pg.transform.scale(image, size)
+        if angle:
+            image = pg.transform.rotate(image, angle)
+        if colorkey is not None:
+            image.set_colorkey(colorkey)
+
+        return image
+
+    def load_rotations(self, path: str, size: tuple, step: int, colorkey: tuple = None,
+                       disk_cache: bool = False) -> RotationFrames:
+        """
+        Get rotation frames of an image (shared by every sprite with the same image, size & step).
+        :param path: image file
+        :param size: size to scale the image to
+        :param step: degrees between frames
+        :param colorkey: transparent color
+        :param disk_cache: keep frames in the disk cache
+        :return: rotation frames
+        """
+        size = (int(size[0]), int(size[1]))
+        key = (path, size, step, colorkey)
+
+        frames = self.__rotations.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        self.misses += 1
+        image = self.load(path, size, colorkey=colorkey)
+        frames = RotationFrames(image, step, path if disk_cache else None, (size, colorkey))
+        self.__rotations[key] = frames
+        return frames
+
+    def reload(self, path: str) -> int:
+        """
+        Load a changed image file again, with all its variants (sizes, rotations...) & their collision masks.
+        New pixels are copied into the shared images, so everyone using them shows the change.
+        :param path: changed image file
+        :return: number of images that changed size (only new users get them)
+        """
+        resized = 0
+        for key, image in list(self.__images.items()):
+            if normpath(key[0]) == normpath(path):
+                alpha, angle, colorkey = key[2]
+                new_image = self.__load_image(key[0], key[1], alpha, angle, colorkey)
+                if not replace_image(image, new_image):
+                    self.__images[key] = new_image
+                    resized += 1
+
+        for (image_path, size, step, colorkey), frames in self.__rotations.items():
+            if normpath(image_path) == normpath(path):
+                frames.reload(self.load(image_path, size, colorkey=colorkey))
+
+        return resized
+
+    def clear(self) -> None:
+        """
+        Remove all images & reset counters.
+        """
+        self.__images.clear()
+        self.__rotations.clear()
+        if self.__atlases is not None:
+            self.__atlases.reset()
+        self.hits = 0
+        self.misses = 0
+
+    def get_memory(self) -> int:
+        """
+        Get memory used by cached images.
+        :return: size in bytes
+        """
+        images = list(self.__images.values())
+        for frames in self.__rotations.values():
+            images.extend(frames.get_made())
+        return sum(image.get_width() * image.get_height() * image.get_bytesize() for image in images)
+
+    def get_stats(self) -> dict:
+        """
+        Get cache stats.
+        :return: dict with size, memory (bytes), hits, misses & hit rate
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self.__images),
+            'memory': self.get_memory(),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def __len__(self) -> int:
+        """
+        Get number of cached images.
+        :return: number of images
+        """
+        return len(self.__images)
+
+
+# shared by all sprites
+asset_cache = AssetCache()
@@ -7,6 +7,10 @@ ASSETS_DIR = join(BASE_DIR, 'assets')
 FONTS_DIR = join(BASE_DIR, 'assets/fonts')
 MAP_DIR = join(BASE_DIR, 'assets/map')
 
+CACHE_DIR = join(BASE_DIR, 'assets_cache')  # processed assets saved on disk (made by the game)
+ATLAS_DIR = join(BASE_DIR, 'assets_atlas')  # texture atlases (made by "python -m game.atlas")
+PACK_FILE = join(BASE_DIR, 'assets.pack')  # images & sounds packed in one file (made by "python -m game.pack")
+
 SPRITE_SHEET_DIR = join(BASE_DIR, 'assets/spritesheet')
 IMAGES_DIR = join(BASE_DIR, 'assets/images')
 MUSIC_DIR = join(BASE_DIR, 'assets/audio/music')
@@ -27,9 +31,36 @@ TARGET_FPS = 60
 
 SETTINGS_FILE = join(BASE_DIR, 'settings.json')
 
+LOADER_THREADS = 4  # threads loading images & sounds in background at startup (0 - load when needed)
+USE_PACK = True  # load images & sounds from the asset pack (if it's built), without decoding
+HOT_RELOAD = False  # dev mode: reload asset files changed while the game is running
+HOT_RELOAD_INTERVAL = 1000  # how often changed asset files are checked for (ms)
+
+# ========== RENDERING ==========
+CULL_SPRITES = True  # draw only the sprites inside the camera view
+GRID_CELL_SIZE = 256  # spatial grid cell size (px), used for finding visible sprites
+MAP_CHUNK_SIZE = 8  # map is baked in chunks of 8x8 tiles
+MAP_CHUNK_MEMORY = 64 * 1024 * 1024  # memory budget for baked map chunks (bytes)
+MAP_CHUNK_PRELOAD = 1  # bake chunks this many chunks ahead of the camera view
+MAP_PATTERN_SIZE = 4  # largest repeating tile pattern (in tiles) baked once & tiled
+DIRTY_RECTS = False  # redraw & update only the parts of the screen that changed (while the camera is still)
+DIRECT_PRESENT = True  # draw straight into the window (no full screen copy) when there is no post-processing
+RENDER_RESOLUTIONS = ((1920, 1080), (1280, 720), (960, 540))  # internal world resolutions (settings)
+USE_ATLAS = True  # load images from texture atlases (if they're built), instead of separate files
+ATLAS_SIZE = 2048  # max texture atlas width & height (px)
+ATLAS_PADDING = 1  # space between images in texture atlases (px)
+DISK_CACHE = True  # keep processed images (scaled, flipped...) on disk & load them without processing next time
+DISK_CACHE_SIZE = 128 * 1024 * 1024  # max disk cache size (bytes), least recently used files are removed
+TEXT_CACHE_SIZE = 256  # max number of rendered texts kept in memory (menus)
+
+# ========== SOUNDS ==========
+MIXER_SETTINGS = (44100, -16, 2, 4096)  # mixer frequency, sample size, channels & buffer size
+SOUND_MEMORY = 16 * 1024 * 1024  # memory budget for decoded sound effects (bytes), music is streamed
+
 # ========== FONTS ==========
 TITLE_FONT = join(FONTS_DIR, 'ZOMBIE.TTF')
 FONT = join(FONTS_DIR, 'Impacted2.0.TTF')
+PRELOAD_FONTS = ((FONT, 25), (FONT, 40), (FONT, 45), (FONT, 50))  # fonts opened at startup (HUD & buttons)
 
 # ========== MAPS ==========
 MAP1 = join(MAP_DIR, 'map_1.tmx')
@@ -92,6 +123,8 @@ SAW_DAMAGE = 30
 SAW_HEALTH = 16
 SAW_SPEED = 1
 SAW_KNOCK_BACK = (1, 1)
+SAW_ROTATION_STEP = 15  # degrees the saw rotates in each frame
+SAW_FRAMES_DISK_CACHE = False  # keep rotated saw frames in the disk cache too (see DISK_CACHE)
 
 # laser
 LASER_DAMAGE = 1
@@ -0,0 +1,117 @@
+from . import pg
+
+
+class DirtyTracker:
+    """
+    Keeps track of what was drawn on screen in the last frame.
+    Used for redrawing (and updating) only the parts of the screen that changed.
+    """
+
+    def __init__(self):
+        """
+        Make the tracker.
+        Starts invalidated, so the first frame is always fully drawn.
+        """
+        self.__drawn = {}  # sprite -> (image, screen rect, health bar) from the last frame
+        self.__hud_rects = []  # HUD rects from the last frame
+        self.__view = None  # camera view from the last frame
+
+    def invalidate(self) -> None:
+        """
+        Force a full redraw on the next frame.
+        """
+        self.__view = None
+
+    def needs_full_redraw(self, view_rect: pg.Rect) -> bool:
+        """
+        Check if the whole screen has to be redrawn.
+        That is when the camera moved or the tracker was invalidated.
+        :param view_rect: current camera view
+        :return: True/False
+        """
+        return self.__view is None or self.__view != view_rect
+
+    def record(self, sprites, camera, view_rect: pg.Rect, hud_rects: list) -> None:
+        """
+        Remember what was drawn in this frame (after a full redraw).
+        :param sprites: drawn sprites
+        :param camera: camera
+        :param view_rect: current camera view
+        :param hud_rects: rects covered by the HUD
+        """
+        self.__drawn = {sprite: DirtyTracker.__get_state(sprite, camera) for sprite in sprites}
+        self.__hud_rects = list(hud_rects)
+        self.__view = pg.Rect(view_rect)
+
+    def get_dirty_rects(self, sprites, camera) -> list:
+        """
+        Get screen rects that changed since the last frame & remember the new state.
+        A sprite is dirty if it appeared, disappeared, moved or changed its image (or health bar).
+        The last frame's HUD rects are always dirty (the HUD is drawn every frame).
+        :param sprites: sprites to draw in this frame
+        :param camera: camera
+        :return: list of screen rects (merged)
+        """
+        dirty = list(self.__hud_rects)
+        drawn = {}
+
+        for sprite in sprites:
+            state = DirtyTracker.__get_state(sprite, camera)
+            drawn[sprite] = state
+            image, rect, health_bar = state
+
+            last = self.__drawn.pop(sprite, None)
+            if last is None:
+                dirty.append(rect)
+            elif last[0] is not image or last[1] != rect or last[2] is not health_bar:
+                dirty.append(last[1])
+                dirty.append(rect)
+
+        # sprites that are not drawn any more (killed or out of view)
+        dirty.extend(rect for _, rect, _ in self.__drawn.values())
+
+        self.__drawn = drawn
+        return DirtyTracker.merge_rects(dirty)
+
+    def get_screen_rects(self) -> list:
+        """
+        Get screen rects of the sprites drawn in this frame (remembered by get_dirty_rects).
+        :return: list of screen rects (in drawing order)
+        """
+        return [rect for _, rect, _ in self.__drawn.values()]
+
+    @staticmethod
+    def __get_state(sprite, camera) -> tuple:
+        """
+        Get what is drawn for the sprite.
+        :param sprite: sprite
+        :param camera: camera
+        :return: (image, screen rect, health bar or None)
+        """
+        return sprite.image, camera.apply(sprite), getattr(sprite, 'health_bar', None)
+
+    def set_hud_rects(self, hud_rects: list) -> None:
+        """
+        Remember the rects covered by the HUD in this frame.
+        :param hud_rects: HUD rects
+        """
+        self.__hud_rects = list(hud_rects)
+
+    @staticmethod
+    def merge_rects(rects: list) -> list:
+        """
+        Merge overlapping rects, so no part of the screen is redrawn twice.
+        :param rects: list of rects
+        :return: list of merged rects
+        """
+        merged = []
+        for rect in rects:
+            if not rect.w or not rect.h:
+                continue
+            rect = pg.Rect(rect)
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
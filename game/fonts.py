@@ -0,0 +1,85 @@
+from . import pg
+from .config import PRELOAD_FONTS
+
+
+class FontRegistry:
+    """
+    Fonts shared by everything that renders text.
+    Each font file is opened (& parsed) only once for each size, everyone using it gets the same font.
+    """
+
+    def __init__(self):
+        """
+        Make an empty registry.
+        """
+        self.__fonts = {}  # (font file or system font name, size, is system font) -> font
+        self.loads = 0
+        self.hits = 0
+
+    def __get(self, name: str, size: int, system: bool) -> pg.font.Font:
+        """
+        Get font (opened if it's not in the registry).
+        :param name: font file or system font name
+        :param size: font size
+        :param system: True if it's a system font
+        :return: font
+        """
+        key = (name, size, system)
+        font = self.__fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.loads += 1
+        font = pg.font.SysFont(name, size) if system else pg.font.Font(name, size)
+        self.__fonts[key] = font
+        return font
+
+    def get(self, font_name: str, size: int) -> pg.font.Font:
+        """
+        Get font from a file.
+        Font is shared, so its style (bold, italic, underline) must not be changed.
+        :param font_name: font file
+        :param size: font size
+        :return: font
+        """
+        return self.__get(font_name, size, False)
+
+    def get_sys_font(self, name: str, size: int) -> pg.font.Font:
+        """
+        Get system font.
+        Font is shared, so its style (bold, italic, underline) must not be changed.
+        :param name: system font name
+        :param size: font size
+        :return: font
+        """
+        return self.__get(name, size, True)
+
+    def preload(self, fonts=PRELOAD_FONTS) -> None:
+        """
+        Open fonts ahead of time (so they're not opened while menus are made or the game is running).
+        :param fonts: list of (font file, size)
+        """
+        for font_name, size in fonts:
+            self.get(font_name, size)
+
+    def clear(self) -> None:
+        """
+        Remove all fonts (they're opened again on next use), fonts that are still used stay alive until they're not.
+        """
+        self.__fonts.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Get registry stats.
+        :return: dict with number of live fonts, loads & hits
+        """
+        return {
+            'fonts': len(self.__fonts),
+            'loads': self.loads,
+            'hits': self.hits,
+        }
+
+
+# shared by everything that renders text
+font_registry = FontRegistry()
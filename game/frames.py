@@ -0,0 +1,91 @@
+from .images import SPLAT_IMAGES, LASER_BULLET_IMAGE
+from .cache import asset_cache, get_mask, replace_image
+from .surface_cache import surface_cache
+
+from pygame.transform import flip, scale
+from os.path import normpath
+
+
+class EffectFrames:
+    """
+    Frames of bullets & effects (muzzle flash, explosion, splat...).
+    Made once (parsed, scaled & flipped) & shared, so spawning an effect costs no image processing.
+    """
+
+    def __init__(self, game):
+        """
+        Make all frames.
+        :param game: game (for sprite sheets)
+        """
+        player_sheet = game.player_sprite_sheet
+        explosion_sheet = game.explosion_sprite_sheet
+
+        # bullet (player), both directions
+        def make_bullet() -> list:
+            bullet = [player_sheet.parse_sprite('bullet_{}.png'.format(i)) for i in range(5)]
+            bullet = EffectFrames.__scale_down(bullet, 1.5)
+            return bullet + [flip(img, True, False) for img in bullet]
+
+        bullet = player_sheet.get_cached(('bullet', 5, 1.5), make_bullet)
+        self.bullet_right = bullet[:5]
+        self.bullet_left = bullet[5:]
+
+        # muzzle flash
+        def make_muzzle_flash() -> list:
+            muzzle = [player_sheet.parse_sprite('muzzle_{}.png'.format(i)) for i in range(5)]
+            return [scale(img, (int(img.get_width() * 2), int(img.get_height() * 1.2))) for img in muzzle]
+
+        self.muzzle_flash = player_sheet.get_cached(('muzzle', 5, 2, 1.2), make_muzzle_flash)
+
+        # explosion
+        def make_explosion() -> list:
+            explosion = [explosion_sheet.parse_sprite('explosion_{}.png'.format(i)) for i in range(9)]
+            return EffectFrames.__scale_down(explosion, 2)
+
+        self.explosion = explosion_sheet.get_cached(('explosion', 9, 2), make_explosion)
+
+        # blood splat
+        self.splat = surface_cache.get(SPLAT_IMAGES, ('splat', 2.5), EffectFrames.__make_splat)
+
+        # laser bullet
+        self.laser_bullet = asset_cache.load(LASER_BULLET_IMAGE)
+
+        # collision masks of bullets (made once, bullets get them at spawn)
+        for image in self.bullet_right + self.bullet_left + [self.laser_bullet]:
+            get_mask(image)
+
+    @staticmethod
+    def __make_splat() -> list:
+        """
+        Make blood splat frames.
+        :return: splat images
+        """
+        return EffectFrames.__scale_down([asset_cache.load(img) for img in SPLAT_IMAGES], 2.5)
+
+    def reload(self, path: str) -> int:
+        """
+        Make the frames made from a changed image file again (splat frames are changed in place).
+        Frames made from sprite sheets are reloaded with the sheet, the laser bullet with the image cache.
+        :param path: changed image file
+        :return: number of frames that changed size (only new effects get them)
+        """
+        if normpath(path) not in [normpath(image) for image in SPLAT_IMAGES]:
+            return 0
+
+        resized = 0
+        new_splat = surface_cache.get(SPLAT_IMAGES, ('splat', 2.5), EffectFrames.__make_splat)
+        for i, (image, new_image) in enumerate(zip(self.splat, new_splat)):
+            if not replace_image(image, new_image):
+                self.splat[i] = new_image
+                resized += 1
+        return resized
+
+    @staticmethod
+    def __scale_down(images: list, divisor: float) -> list:
+        """
+        Scale images down (width & height are floored).
+        :param images: images
+        :param divisor: how many times smaller
+        :return: scaled images
+        """
+        return [scale(img, (int(img.get_width() // divisor), int(img.get_height() // divisor))) for img in images]
@@ -0,0 +1,69 @@
+from . import pg
+from .config import ASSETS_DIR, HOT_RELOAD_INTERVAL
+from os import walk, stat
+from os.path import join, normpath
+
+
+class AssetWatcher:
+    """
+    Watches asset files for changes (dev mode).
+    Files are polled (modification time & size), so it works the same on every platform.
+    """
+
+    def __init__(self, directory: str = ASSETS_DIR, interval: int = HOT_RELOAD_INTERVAL):
+        """
+        Start watching the directory.
+        :param directory: assets directory (with subdirectories)
+        :param interval: how often files are checked (ms)
+        """
+        self.__directory = directory
+        self.__interval = interval
+        self.__last_check = pg.time.get_ticks()
+        self.__files = self.__scan()
+
+    def __scan(self) -> dict:
+        """
+        Get state of all files in the directory.
+        :return: file -> (modification time, size)
+        """
+        files = {}
+        for root, _, names in walk(self.__directory):
+            for name in names:
+                path = normpath(join(root, name))
+                try:
+                    file_stat = stat(path)
+                except OSError:
+                    continue  # removed while scanning
+                files[path] = (file_stat.st_mtime, file_stat.st_size)
+        return files
+
+    def get_changed(self) -> list:
+        """
+        Get files changed since the last check (files are checked once every interval).
+        New & removed files are not given (nothing uses new files & removed files are kept loaded).
+        :return: sorted list of changed files
+        """
+        now = pg.time.get_ticks()
+        if now - self.__last_check < self.__interval:
+            return []
+        self.__last_check = now
+
+        files = self.__scan()
+        changed = [path for path, state in files.items() if self.__files.get(path, state) != state]
+        self.__files = files
+        return sorted(changed)
+
+    @staticmethod
+    def report(path: str, resized: int = 0, error: Exception = None) -> None:
+        """
+        Tell the developer a changed file was reloaded (console output, dev mode only).
+        :param path: changed file
+        :param resized: number of images that changed size
+        :param error: error if the file could not be reloaded
+        """
+        if error is not None:
+            print(f'[hot reload] could not reload {path}: {error}')
+        elif resized:
+            print(f'[hot reload] reloaded {path} ({resized} images changed size, restart the level to see them)')
+        else:
+            print(f'[hot reload] reloaded {path}')
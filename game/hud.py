@@ -0,0 +1,214 @@
+from . import pg
+from .config import WIDTH, HEIGHT, FONT, PLAYER_HEALTH, GUN_COOL_DOWN, WHITE, GREEN, YELLOW, RED, DARK_GREY
+from .images import HEALTH_PACK_IMAGE, BULLET_ICON
+from .cache import asset_cache
+from .fonts import font_registry
+
+from time import strftime, gmtime
+
+
+class HudWidget:
+    """
+    Single HUD element (fps, score, health bar...).
+    Keeps its rendered surface & renders it again only when its value changes.
+    """
+
+    def __init__(self, render):
+        """
+        Make the widget.
+        :param render: function that renders the value: render(value) -> pg.Surface
+        """
+        self.__render = render
+        self.__value = None
+        self.surface = None
+        self.renders = 0  # number of times the widget was rendered
+
+    def update(self, value) -> bool:
+        """
+        Set widget value & render the widget if the value changed.
+        :param value: new value
+        :return: True if the widget was rendered again
+        """
+        if self.surface is not None and value == self.__value:
+            return False
+
+        self.__value = value
+        self.surface = self.__render(value)
+        self.renders += 1
+        return True
+
+
+class Hud:
+    """
+    Heads-up display (fps, score, health bar, gun bar & game timer).
+    Widgets are rendered only when their values change, every frame the cached surfaces are drawn.
+    """
+
+    def __init__(self, default_font: pg.font.Font):
+        """
+        Make the HUD & load its fonts and icons (once).
+        :param default_font: font for fps & game timer
+        """
+        self.__default_font = default_font
+        self.__score_font = font_registry.get(FONT, 25)
+
+        self.__health_icon = asset_cache.load(HEALTH_PACK_IMAGE, (27, 27))
+        self.__bullet_icon = asset_cache.load(BULLET_ICON, (27, 27))
+
+        self.__widgets = {
+            'fps': HudWidget(self.__render_fps),
+            'score': HudWidget(self.__render_score),
+            'health': HudWidget(self.__render_health),
+            'gun_bar': HudWidget(self.__render_gun_bar),
+            'game_timer': HudWidget(self.__render_game_timer),
+        }
+
+        self.__shown = {}  # widget name -> position, widgets shown in the last update
+
+    # rendering
+    def __render_fps(self, value: tuple) -> pg.Surface:
+        """
+        Render FPS (& the number of culled sprites below it, if given).
+        :param value: (fps, culled sprites or None)
+        :return: rendered widget
+        """
+        fps, culled = value
+        fps_text = self.__default_font.render(str(fps), True, GREEN)
+        if culled is None:
+            return fps_text
+
+        culled_text = self.__default_font.render(f'-{culled}', True, GREEN)
+        surface = pg.Surface((max(fps_text.get_width(), culled_text.get_width()), 35 + culled_text.get_height()),
+                             pg.SRCALPHA)
+        surface.blit(fps_text, (0, 0))
+        surface.blit(culled_text, (0, 35))
+        return surface
+
+    def __render_score(self, score: int) -> pg.Surface:
+        """
+        Render player score.
+        :param score: player score
+        :return: rendered widget
+        """
+        return self.__score_font.render(f'Score: {str(score)}', True, WHITE)
+
+    def __render_game_timer(self, seconds: int) -> pg.Surface:
+        """
+        Render game timer.
+        :param seconds: seconds left
+        :return: rendered widget
+        """
+        return self.__default_font.render(strftime('%M:%S', gmtime(seconds)), True, WHITE)
+
+    @staticmethod
+    def __render_bar(icon: pg.Surface, percentage: float) -> pg.Surface:
+        """
+        Render a bar with an icon next to it.
+        Icon is 35 px left & 5 px above the bar.
+        :param icon: icon image
+        :param percentage: bar fill (0 - 1)
+        :return: rendered bar
+        """
+        # don't go below 0
+        if percentage < 0:
+            percentage = 0
+
+        bar_width = 100
+        bar_height = 20
+        fill_width = percentage * bar_width
+
+        surface = pg.Surface((35 + bar_width, max(icon.get_height(), 5 + bar_height)), pg.SRCALPHA)  # whole icon fits
+
+        outline_rect = pg.Rect(35, 5, bar_width, bar_height)
+        filled_rect = pg.Rect(35, 5, fill_width, bar_height)
+
+        # color
+        if percentage >= 0.6:
+            color = GREEN
+        elif percentage >= 0.3:
+            color = YELLOW
+        else:
+            color = RED
+
+        # drawing
+        surface.blit(icon, (0, 0))  # icon next to the bar
+        pg.draw.rect(surface, DARK_GREY, outline_rect)  # fix drawing bug (color below bar color)
+        pg.draw.rect(surface, color, filled_rect)  # filled rect (bar color)
+        pg.draw.rect(surface, color, outline_rect, 2)  # outline rect
+        return surface
+
+    def __render_health(self, health: int) -> pg.Surface:
+        """
+        Render player health bar.
+        :param health: player health
+        :return: rendered widget
+        """
+        return Hud.__render_bar(self.__health_icon, health / PLAYER_HEALTH)
+
+    def __render_gun_bar(self, gun_cool_down: float) -> pg.Surface:
+        """
+        Render player gun cool down bar.
+        :param gun_cool_down: gun cool down
+        :return: rendered widget
+        """
+        return Hud.__render_bar(self.__bullet_icon, gun_cool_down / GUN_COOL_DOWN)
+
+    # layout
+    @staticmethod
+    def __get_positions(shown) -> dict:
+        """
+        Get widget positions.
+        Score & gun bar move up when the widgets above them are turned off.
+        :param shown: names of the widgets that are shown
+        :return: widget name -> (x, y)
+        """
+        health_on = 'health' in shown
+        gun_bar_on = 'gun_bar' in shown
+
+        # gun bar
+        gun_bar_offset = 380 if health_on else 420
+
+        # score
+        if health_on and gun_bar_on:  # all on
+            score_offset = 350
+        elif health_on or gun_bar_on:  # only one on
+            score_offset = 390
+        else:  # all off
+            score_offset = 430
+
+        return {
+            'fps': (WIDTH / 2 + 730, HEIGHT / 2 - 430),
+            'score': (WIDTH / 2 - 750, HEIGHT / 2 - score_offset),
+            'health': (WIDTH / 2 - 720 - 35, HEIGHT / 2 - 420 - 5),
+            'gun_bar': (WIDTH / 2 - 720 - 35, HEIGHT / 2 - gun_bar_offset - 5),
+            'game_timer': (WIDTH / 2, HEIGHT / 2 - 420),
+        }
+
+    def update(self, values: dict) -> None:
+        """
+        Update HUD widgets.
+        Only the widgets whose values changed are rendered again.
+        :param values: widget name -> value, for widgets that are shown (turned on in settings)
+            fps: (fps, culled sprites or None), score: int, health: int, gun_bar: float, game_timer: int
+        """
+        positions = Hud.__get_positions(values)
+        self.__shown = {name: positions[name] for name in values}
+
+        for name, value in values.items():
+            self.__widgets[name].update(value)
+
+    def draw(self, surface: pg.Surface) -> list:
+        """
+        Draw shown widgets.
+        :param surface: surface to draw on (game display)
+        :return: list of rects covered by the HUD
+        """
+        widgets = self.__widgets
+        return surface.blits([(widgets[name].surface, position) for name, position in self.__shown.items()])
+
+    def get_renders(self) -> dict:
+        """
+        Get the number of times each widget was rendered.
+        :return: widget name -> number of renders
+        """
+        return {name: widget.renders for name, widget in self.__widgets.items()}
@@ -0,0 +1,123 @@
+from . import pg
+from .config import ATLAS_DIR, USE_ATLAS, LOADER_THREADS
+from .images import PLAYER_SPRITE_SHEET, ZOMBIE_SPRITE_SHEET, EXPLOSION_SPRITE_SHEET
+from .sounds import MENU_IN_SOUND, MENU_OUT_SOUND, SWITCH_TOGGLE_SOUND, LEVEL_START_SOUND
+from .pack import asset_pack
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from os.path import join, normpath
+
+
+def get_manifest() -> list:
+    """
+    Get assets loaded at startup (in loading order).
+    "menu" assets are needed before the main menu is shown, "game" assets when the game starts.
+    Other sounds are decoded on first use & music is streamed (see audio.py).
+    :return: list of (group, kind, file), kind is "image" or "sound"
+    """
+    manifest = [
+        # main menu
+        ('menu', 'sound', MENU_IN_SOUND),
+        ('menu', 'sound', MENU_OUT_SOUND),
+        ('menu', 'sound', SWITCH_TOGGLE_SOUND),
+    ]
+
+    # texture atlases (menu images are in them)
+    if USE_ATLAS:
+        manifest.extend(('menu', 'image', atlas) for atlas in sorted(glob(join(ATLAS_DIR, 'atlas_*.png'))))
+
+    # sprite sheets
+    for sprite_sheet in (PLAYER_SPRITE_SHEET, ZOMBIE_SPRITE_SHEET, EXPLOSION_SPRITE_SHEET):
+        manifest.append(('game', 'image', sprite_sheet))
+
+    # level start sound (plays as soon as the game starts)
+    manifest.append(('game', 'sound', LEVEL_START_SOUND))
+
+    return manifest
+
+
+class AssetLoader:
+    """
+    Loads (decodes) images & sounds from a manifest in background threads.
+    Pygame decoders release the GIL, so files are decoded in parallel while the game starts (& the menu is shown).
+    Images are given as they're decoded (not converted), converting must be done in the main thread.
+    Getting an asset that's still loading waits for it, so nothing has to check if a group is loaded.
+    """
+
+    def __init__(self, threads: int = LOADER_THREADS):
+        """
+        Make the loader.
+        :param threads: number of loading threads (0 - files are loaded in the main thread, when they're needed)
+        """
+        self.__threads = threads
+        self.__futures = {}  # file (normalized path) -> future (loading result)
+
+    def start(self, manifest: list) -> None:
+        """
+        Start loading assets in background.
+        :param manifest: list of (group, kind, file)
+        """
+        if self.__threads <= 0:
+            return
+
+        executor = ThreadPoolExecutor(self.__threads, thread_name_prefix='asset_loader')
+        for _, kind, path in manifest:
+            key = normpath(path)
+            if key not in self.__futures:
+                self.__futures[key] = executor.submit(AssetLoader.__load, kind, path)
+        executor.shutdown(wait=False)  # threads finish when everything is loaded
+
+    @staticmethod
+    def __load(kind: str, path: str):
+        """
+        Load an asset (from the asset pack if it's built, without decoding).
+        :param kind: "image" or "sound"
+        :param path: file
+        :return: image (not converted) or sound
+        """
+        if kind == 'image':
+            image = asset_pack.get_image(path)
+            return image if image is not None else pg.image.load(path)
+
+        sound = asset_pack.get_sound(path)
+        return sound if sound is not None else pg.mixer.Sound(path)
+
+    def __get(self, kind: str, path: str):
+        """
+        Get loaded asset (waits if it's still loading).
+        Each asset is given only once, assets that are not in the manifest (or given already) are loaded now.
+        :param kind: "image" or "sound"
+        :param path: file
+        :return: image (not converted) or sound
+        """
+        future = self.__futures.pop(normpath(path), None)
+        if future is None:
+            return AssetLoader.__load(kind, path)
+        return future.result()
+
+    def get_image(self, path: str) -> pg.Surface:
+        """
+        Get decoded image (convert it before drawing).
+        :param path: image file
+        :return: image
+        """
+        return self.__get('image', path)
+
+    def get_sound(self, path: str) -> pg.mixer.Sound:
+        """
+        Get sound.
+        :param path: sound file
+        :return: sound
+        """
+        return self.__get('sound', path)
+
+    def discard(self, path: str) -> None:
+        """
+        Drop loaded asset that's not given yet (it's loaded again when it's needed), used when the file changes.
+        :param path: file
+        """
+        self.__futures.pop(normpath(path), None)
+
+
+# shared by everything that loads images & sounds at startup
+asset_loader = AssetLoader()
@@ -1,8 +1,10 @@
 from . import pg
 from .config import VERSION, WIDTH, HEIGHT, GAME_TITLE, TITLE_FONT, FONT, SETTINGS_FILE, WHITE, RED, DARK_GREY, \
-    SUBMENU_GREY, GAME_COMPLETED_POINTS
+    SUBMENU_GREY, GAME_COMPLETED_POINTS, RENDER_RESOLUTIONS
 from .sounds import *
 from .button import TextButton, VolumeControl, VolumeIndicator, MuteToggle, OnOffSwitch
+from .text import TextCache
+from .audio import LazySound, MusicTrack
 import json
 
 
@@ -27,6 +29,7 @@ class Menu:
         'show_gun_bar': True,
         'gun_upgrade_on': True,
         'show_game_timer': True,
+        'render_resolution': [WIDTH, HEIGHT],
         'menu_music_on': True,
         'menu_music_volume': 1.0,
         'menu_nav_sounds_on': True,
@@ -73,6 +76,9 @@ class Menu:
         'zombie_moan_volume': 1.0
     }
 
+    # rendered texts (shared by all menus, including pause & game over)
+    text_cache = TextCache()
+
     def __init__(self, game):
         """
         Initialize menu.
@@ -83,25 +89,31 @@ class Menu:
         self.mid_x = WIDTH / 2
         self.mid_y = HEIGHT / 2
 
-        # for drawing
-        self.game_display = self.game.display
-
         self.__load_settings()
 
         self.run_display = True
         self.click = False
 
+    @property
+    def game_display(self) -> pg.Surface:
+        """
+        Get the surface menus are drawn on.
+        :return: game display
+        """
+        return self.game.display
+
     def draw_menu(self) -> None:
         """
         Draw menu on screen.
         """
-        self.game.window.blit(self.game_display, (0, 0))
-        pg.display.update()
+        self.game.present()
 
     def check_menu_events(self) -> None:
         """
         Check menu events.
         """
+        self.game.reload_changed_assets()  # dev mode
+
         for event in pg.event.get():
             # quit
             if event.type == pg.QUIT:
@@ -126,17 +138,17 @@ class Menu:
                 if event.button == 1:
                     self.click = True
 
-    def __make_text(self, text: str, font_name: pg.font.Font, size: int, color: tuple, pos: tuple) -> None:
+    def __make_text(self, text: str, font_name: str, size: int, color: tuple, pos: tuple) -> None:
         """
         Draw text on screen.
+        Rendered text is taken from the text cache.
         :param text: text to draw
         :param font_name: font name
         :param size: font size
         :param color: font color
         :param pos: position (x, y)
         """
-        font = pg.font.Font(font_name, size)
-        text_surface = font.render(text, True, color)
+        text_surface = self.text_cache.render(text, font_name, size, color)
         text_rect = text_surface.get_rect()
         text_rect.center = (pos[0], pos[1])
         self.game.display.blit(text_surface, text_rect)
@@ -309,10 +321,6 @@ class MainMenu(Menu):
         # draw buttons
         self.draw_buttons(self.buttons)
 
-        # draw if restart required
-        if self.game.settings_menu.restart_required:
-            self.draw_text('Restart required to play the game', 40, WHITE, RED, (0, 300))
-
         # draw game version
         self.draw_text(VERSION, 20, RED, WHITE, (720, 400))
 
@@ -330,10 +338,9 @@ class MainMenu(Menu):
                     # start game
                     if button == self.start_game_btn:
                         if self.click:
-                            if not self.game.settings_menu.restart_required:
-                                self.game.level = 1  # ensure level is 1 on new game start
-                                self.menu_music.stop()  # stop menu music
-                                self.game.run()  # run the game
+                            self.game.level = 1  # ensure level is 1 on new game start
+                            self.menu_music.stop()  # stop menu music
+                            self.game.run()  # run the game
 
                     # settings
                     if button == self.settings_btn:
@@ -383,6 +390,9 @@ class MainMenu(Menu):
         self.gun_bar_on = self.settings['show_gun_bar']
         self.gun_upgrade_on = self.settings['gun_upgrade_on']
         self.game_timer_on = self.settings['show_game_timer']
+        self.render_resolution = tuple(self.settings['render_resolution'])
+        if self.render_resolution not in RENDER_RESOLUTIONS:  # fix edited settings file
+            self.render_resolution = RENDER_RESOLUTIONS[0]
 
         # sound, volume & controls settings
         self.__load_sound_flags()
@@ -453,6 +463,12 @@ class MainMenu(Menu):
         self.zombie_die_sound_volume = self.settings['zombie_die_volume']
         self.zombie_moan_sounds_volume = self.settings['zombie_moan_volume']
 
+    def apply_controls(self) -> None:
+        """
+        Load changed controls (used right away, other settings flags are changed by the settings menu).
+        """
+        self.__load_controls()
+
     def __load_controls(self) -> None:
         """
         Load controls from settings.json.
@@ -477,38 +493,39 @@ class MainMenu(Menu):
     def __init_sounds(self) -> None:
         """
         Make sounds and set their starting volume (based on settings.json).
+        Sound effects are decoded on first use, music is streamed (see audio.py).
         """
         # general sounds
-        self.menu_music = pg.mixer.Sound(MENU_MUSIC)
-        self.menu_in_sound = pg.mixer.Sound(MENU_IN_SOUND)
-        self.menu_out_sound = pg.mixer.Sound(MENU_OUT_SOUND)
-        self.switch_toggle_sound = pg.mixer.Sound(SWITCH_TOGGLE_SOUND)
-        self.high_score_sound = pg.mixer.Sound(HIGH_SCORE_SOUND)
-        self.game_over_music = pg.mixer.Sound(GAME_OVER_MUSIC)
-        self.level_start_sound = pg.mixer.Sound(LEVEL_START_SOUND)
+        self.menu_music = MusicTrack(MENU_MUSIC)
+        self.menu_in_sound = LazySound(MENU_IN_SOUND)
+        self.menu_out_sound = LazySound(MENU_OUT_SOUND)
+        self.switch_toggle_sound = LazySound(SWITCH_TOGGLE_SOUND)
+        self.high_score_sound = LazySound(HIGH_SCORE_SOUND)
+        self.game_over_music = MusicTrack(GAME_OVER_MUSIC)
+        self.level_start_sound = LazySound(LEVEL_START_SOUND)
 
         # game sfx
-        self.door_switch_press_sound = pg.mixer.Sound(DOOR_SWITCH_PRESS_SOUND)
-        self.door_switch_fail_sound = pg.mixer.Sound(DOOR_SWITCH_FAIL_SOUND)
-        self.door_open_sound = pg.mixer.Sound(DOOR_OPEN_SOUND)
-        self.xp_pickup_sound = pg.mixer.Sound(XP_PICKUP_SOUND)
-        self.coin_pickup_sound = pg.mixer.Sound(COIN_PICKUP_SOUND)
-        self.health_pickup_sound = pg.mixer.Sound(HEALTH_PICKUP_SOUND)
-        self.key_pickup_sound = pg.mixer.Sound(KEY_PICKUP_SOUND)
-        self.lever_pull_sound = pg.mixer.Sound(LEVER_PULL_SOUND)
-        self.laser_sound = pg.mixer.Sound(LASER_SOUND)
-        self.laser_gun_sound = pg.mixer.Sound(LASER_GUN_SOUND)
-        self.burn_sound = pg.mixer.Sound(BURN_SOUND)
-        self.saw_sound = pg.mixer.Sound(SAW_SOUND)
-        self.explosion_sound = pg.mixer.Sound(EXPLOSION_SOUND)
+        self.door_switch_press_sound = LazySound(DOOR_SWITCH_PRESS_SOUND)
+        self.door_switch_fail_sound = LazySound(DOOR_SWITCH_FAIL_SOUND)
+        self.door_open_sound = LazySound(DOOR_OPEN_SOUND)
+        self.xp_pickup_sound = LazySound(XP_PICKUP_SOUND)
+        self.coin_pickup_sound = LazySound(COIN_PICKUP_SOUND)
+        self.health_pickup_sound = LazySound(HEALTH_PICKUP_SOUND)
+        self.key_pickup_sound = LazySound(KEY_PICKUP_SOUND)
+        self.lever_pull_sound = LazySound(LEVER_PULL_SOUND)
+        self.laser_sound = LazySound(LASER_SOUND)
+        self.laser_gun_sound = LazySound(LASER_GUN_SOUND)
+        self.burn_sound = LazySound(BURN_SOUND)
+        self.saw_sound = LazySound(SAW_SOUND)
+        self.explosion_sound = LazySound(EXPLOSION_SOUND)
 
         # sprites sounds
-        self.player_jump_sound = pg.mixer.Sound(PLAYER_JUMP_SOUND)
-        self.player_hit_sound = pg.mixer.Sound(PLAYER_HIT_SOUND)
-        self.gun_sound = pg.mixer.Sound(GUN_SOUND)
-        self.zombie_hit_sound = pg.mixer.Sound(ZOMBIE_HIT_SOUND)
-        self.zombie_die_sound = pg.mixer.Sound(ZOMBIE_DIE_SOUND)
-        self.zombie_moan_sounds = [pg.mixer.Sound(sound) for sound in ZOMBIE_MOAN_SOUNDS]
+        self.player_jump_sound = LazySound(PLAYER_JUMP_SOUND)
+        self.player_hit_sound = LazySound(PLAYER_HIT_SOUND)
+        self.gun_sound = LazySound(GUN_SOUND)
+        self.zombie_hit_sound = LazySound(ZOMBIE_HIT_SOUND)
+        self.zombie_die_sound = LazySound(ZOMBIE_DIE_SOUND)
+        self.zombie_moan_sounds = [LazySound(sound) for sound in ZOMBIE_MOAN_SOUNDS]
 
         # set volumes for sounds
         self.__set_volumes()
@@ -581,7 +598,13 @@ class SettingsMenu(Menu):
         self.changing_control = False  # when changing control (on click)
         self.button_changing = []  # list of buttons being changed
         self.error_changing = False  # True if error occurred when changing control
-        self.restart_required = False  # True if control is changed
+
+    def save_settings(self) -> None:
+        """
+        Save settings.json file & apply the changed settings right away (no restart needed).
+        """
+        super().save_settings()
+        self.game.apply_settings()
 
     def display_menu(self) -> None:
         """
@@ -676,32 +699,37 @@ class SettingsMenu(Menu):
         Make general settings buttons.
         """
         # game music
-        self.game_music_btn = TextButton('Game music', 50, (-100, -255))
-        self.game_music_switch = OnOffSwitch(self.main_menu.game_music_on, (220, -250))
+        self.game_music_btn = TextButton('Game music', 50, (-100, -265))
+        self.game_music_switch = OnOffSwitch(self.main_menu.game_music_on, (220, -260))
 
         # fps
-        self.show_fps_btn = TextButton('Show FPS', 50, (-100, -170))
-        self.show_fps_switch = OnOffSwitch(self.main_menu.fps_on, (220, -165))
+        self.show_fps_btn = TextButton('Show FPS', 50, (-100, -190))
+        self.show_fps_switch = OnOffSwitch(self.main_menu.fps_on, (220, -185))
 
         # score
-        self.show_score_btn = TextButton('Score', 50, (-100, -85))
-        self.show_score_switch = OnOffSwitch(self.main_menu.score_on, (220, -80))
+        self.show_score_btn = TextButton('Score', 50, (-100, -115))
+        self.show_score_switch = OnOffSwitch(self.main_menu.score_on, (220, -110))
 
         # player health bar
-        self.show_health_btn = TextButton('Health bar', 50, (-100, 0))
-        self.show_health_switch = OnOffSwitch(self.main_menu.health_on, (220, 5))
+        self.show_health_btn = TextButton('Health bar', 50, (-100, -40))
+        self.show_health_switch = OnOffSwitch(self.main_menu.health_on, (220, -35))
 
         # gun bar
-        self.show_gun_bar_btn = TextButton('Gun bar', 50, (-100, 85))
-        self.show_gun_bar_switch = OnOffSwitch(self.main_menu.gun_bar_on, (220, 90))
+        self.show_gun_bar_btn = TextButton('Gun bar', 50, (-100, 35))
+        self.show_gun_bar_switch = OnOffSwitch(self.main_menu.gun_bar_on, (220, 40))
 
         # gun upgrade
-        self.gun_upgrade_btn = TextButton('Gun upgrade', 50, (-100, 170))
-        self.gun_upgrade_switch = OnOffSwitch(self.main_menu.gun_upgrade_on, (220, 175))
+        self.gun_upgrade_btn = TextButton('Gun upgrade', 50, (-100, 110))
+        self.gun_upgrade_switch = OnOffSwitch(self.main_menu.gun_upgrade_on, (220, 115))
 
         # game timer
-        self.show_game_timer_btn = TextButton('Game timer', 50, (-100, 255))
-        self.show_game_timer_switch = OnOffSwitch(self.main_menu.game_timer_on, (220, 260))
+        self.show_game_timer_btn = TextButton('Game timer', 50, (-100, 185))
+        self.show_game_timer_switch = OnOffSwitch(self.main_menu.game_timer_on, (220, 190))
+
+        # render resolution (one button for each resolution, click to switch to the next one)
+        self.render_resolution_btn = TextButton('Resolution', 50, (-100, 260))
+        self.render_resolution_switches = {resolution: TextButton(f'{resolution[0]}x{resolution[1]}', 40, (220, 263))
+                                           for resolution in RENDER_RESOLUTIONS}
 
         # all buttons in general settings (for drawing)
         self.all_general_settings_buttons = (self.game_music_btn,
@@ -711,6 +739,7 @@ class SettingsMenu(Menu):
                                              self.show_gun_bar_btn,
                                              self.gun_upgrade_btn,
                                              self.show_game_timer_btn,
+                                             self.render_resolution_btn,
                                              self.game_music_switch,
                                              self.show_fps_switch,
                                              self.show_score_switch,
@@ -839,6 +868,30 @@ class SettingsMenu(Menu):
             else:
                 switch.hovered = False
 
+        # render resolution
+        resolution_switch = self.__get_render_resolution_switch()
+        if resolution_switch.rect.collidepoint(pg.mouse.get_pos()):
+            resolution_switch.hovered = True
+            if self.click:
+                play_sound(self.main_menu.switch_toggle_sound_on, self.main_menu.switch_toggle_sound)
+                resolution_switch.hovered = False
+
+                # next resolution
+                index = RENDER_RESOLUTIONS.index(self.main_menu.render_resolution)
+                resolution = RENDER_RESOLUTIONS[(index + 1) % len(RENDER_RESOLUTIONS)]
+                self.main_menu.render_resolution = resolution
+                self.settings['render_resolution'] = list(resolution)
+                self.save_settings()
+        else:
+            resolution_switch.hovered = False
+
+    def __get_render_resolution_switch(self) -> TextButton:
+        """
+        Get render resolution button for the current resolution.
+        :return: button
+        """
+        return self.render_resolution_switches[self.main_menu.render_resolution]
+
     # sounds settings
     def __initialize_sounds_settings_buttons(self) -> None:
         """
@@ -2110,10 +2163,13 @@ class SettingsMenu(Menu):
                         else:
                             self.error_changing = True
 
-        # if control is changed
+        # if control is changed (applied when saved), show the new key
         if changed:
             self.changing_control = False
             self.error_changing = False
+            self.used_keys = [control for control in self.main_menu.controls]
+            key = self.settings[control]
+            button.set_text('Space' if key == ' ' else key)
 
     def __set_feedback_text(self) -> None:
         """
@@ -2137,9 +2193,6 @@ class SettingsMenu(Menu):
             self.draw_text('Changed', 40, WHITE, RED, (x, y))
             if self.error_changing:
                 self.draw_text('Error changing, chose another key', 30, WHITE, RED, (0, 305))
-            else:
-                self.draw_text('Restart to apply changes', 30, WHITE, RED, (0, 305))
-            self.restart_required = True
 
     # draw functions
     def __draw_buttons_and_text(self) -> None:
@@ -2171,6 +2224,7 @@ class SettingsMenu(Menu):
         if self.active_tab == self.general_settings_menu_tab:
             # draw general settings buttons
             self.draw_buttons(self.all_general_settings_buttons)
+            self.draw_buttons(self.__get_render_resolution_switch())
 
         elif self.active_tab == self.sounds_settings_menu_tab:
             # draw submenu (only when sounds tab is active)
@@ -2304,8 +2358,8 @@ class SettingsMenu(Menu):
         """
         # general settings
         if tab == self.general_settings_menu_tab:
-            # right side (on/off switches)
-            for switch in self.on_off_switches:
+            # right side (render resolution & on/off switches)
+            for switch in (self.__get_render_resolution_switch(),) + self.on_off_switches:
                 top_left = (switch.rect.topleft[0] - 10, switch.rect.topleft[1] + 4)
                 bottom_left = (switch.rect.bottomleft[0] - 10, switch.rect.bottomleft[1] - 5)
                 top_right = (switch.rect.topright[0] + 10, switch.rect.topright[1] + 4)
@@ -2644,6 +2698,17 @@ class ConfirmationMenu(Menu):
 
 
 # pause & game over menus
+def set_hovered_buttons(buttons) -> None:
+    """
+    Set hover effect on buttons under the mouse.
+    Pause & game over menus don't inherit "Menu" class, so hover is set before drawing the buttons.
+    :param buttons: buttons tuple
+    """
+    mouse_pos = pg.mouse.get_pos()
+    for button in buttons:
+        button.hovered = button.rect.collidepoint(mouse_pos)
+
+
 class PauseMenu:
     """
     Creates pause menu.
@@ -2659,14 +2724,16 @@ class PauseMenu:
 
         self.main_menu = self.game.main_menu
 
+        # make buttons (once)
+        self.__init_buttons()
+
     def display_menu(self) -> None:
         """
         Display pause menu.
         """
         self.__draw_menu()
         self.__check_clicks()
-        self.game.window.blit(self.game.display, (0, 0))
-        pg.display.update()
+        self.game.present()
 
     def __init_buttons(self) -> None:
         """
@@ -2687,9 +2754,6 @@ class PauseMenu:
         # pause sounds
         PauseMenu.__pause_sounds()
 
-        # initialize buttons
-        self.__init_buttons()
-
         # draw pause dim image
         self.game.display.blit(self.game.pause_dim_image, (0, 0))
 
@@ -2697,7 +2761,8 @@ class PauseMenu:
         self.main_menu.draw_text(GAME_TITLE, 130, WHITE, RED, (0, -300))
         self.main_menu.draw_text('Paused', 100, RED, WHITE, (0, -180))
 
-        # draw buttons
+        # draw buttons (with hover effect)
+        set_hovered_buttons(self.buttons)
         self.main_menu.draw_buttons(self.buttons)
 
     def __check_clicks(self) -> None:
@@ -2727,8 +2792,6 @@ class PauseMenu:
                     if self.game.click:
                         self.game.quit_game()
 
-                # to draw hover effect (pause menu doesn't inherit "Menu" class)
-                self.main_menu.draw_buttons(button)
             else:
                 button.hovered = False
 
@@ -2767,6 +2830,9 @@ class GameOverMenu:
                                  self.main_menu.burn_sound,
                                  self.main_menu.laser_sound)
 
+        # make buttons (once)
+        self.__init_buttons()
+
     def display_menu(self) -> None:
         """
         Display game over menu.
@@ -2794,16 +2860,14 @@ class GameOverMenu:
         # stop sounds
         self.__stop_sounds()
 
-        # make game over buttons
-        self.__init_buttons()
-
         # fill the display with dark grey color
         self.game.display.fill(DARK_GREY)
 
         # draw game over text & message
         self.__draw_text()
 
-        # draw buttons
+        # draw buttons (with hover effect)
+        set_hovered_buttons(self.buttons)
         self.main_menu.draw_buttons(self.buttons)
 
     def __draw_text(self) -> None:
@@ -2869,8 +2933,6 @@ class GameOverMenu:
                     if self.game.click:
                         self.game.quit_game()
 
-                # to draw hover effect (game over menu doesn't inherit "Menu" class)
-                self.main_menu.draw_buttons(button)
             else:
                 button.hovered = False
 
@@ -2885,7 +2947,7 @@ class GameOverMenu:
         # stop zombie moan sounds
         for sound in self.main_menu.zombie_moan_sounds:
             sound.stop()
-        pg.mixer.music.stop()
+        self.game.game_music.stop()  # only if it's playing (game over music uses the same stream)
 
     def set_game_completed(self) -> None:
         """
@@ -0,0 +1,253 @@
+from . import pg
+from .config import BASE_DIR, ASSETS_DIR, MUSIC_DIR, ATLAS_DIR, PACK_FILE, USE_PACK, MIXER_SETTINGS
+from os import replace, walk
+from os.path import join, getmtime, getsize, relpath
+from glob import glob
+from hashlib import sha1
+from threading import Lock
+import json
+import mmap
+import struct
+
+# bump when the file format changes (old packs are not used any more)
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4sII')  # magic, format version, index length
+ALIGNMENT = 16  # payloads start at multiples of 16 bytes
+
+
+def _align(offset: int) -> int:
+    """
+    Get the next aligned offset.
+    :param offset: offset (bytes)
+    :return: aligned offset
+    """
+    return offset + (-offset % ALIGNMENT)
+
+
+def get_pack_name(path: str) -> str:
+    """
+    Get asset name used in the pack.
+    :param path: asset file
+    :return: path relative to the game directory (with "/")
+    """
+    return relpath(path, BASE_DIR).replace('\\', '/')
+
+
+class AssetPack:
+    """
+    Images & sound effects packed in one file (see build_pack), memory mapped.
+    Images are made straight from the mapped pixels & sounds from the mapped samples,
+    so assets are not opened & decoded one by one. Pages of the file are read only when they're used.
+    Assets changed after the pack was built are not found (they're loaded from their own files).
+    """
+
+    def __init__(self, filename: str = PACK_FILE, enabled: bool = USE_PACK):
+        """
+        Make the pack (file is mapped on first use).
+        :param filename: pack file
+        :param enabled: use the pack (if False, assets are never found)
+        """
+        self.__filename = filename
+        self.__enabled = enabled
+        self.__lock = Lock()  # assets are loaded from background threads too
+        self.__entries = None  # asset name -> index entry
+        self.__data = None  # mapped payloads
+        self.__mixer = None  # mixer format of the packed sounds
+        self.images = 0
+        self.sounds = 0
+
+    def __get_entries(self) -> dict:
+        """
+        Map the pack & load its index (only once).
+        :return: asset name -> index entry (empty if the pack is not built)
+        """
+        with self.__lock:
+            if self.__entries is None:
+                self.__entries = {}
+                if self.__enabled:
+                    self.__open()
+            return self.__entries
+
+    def __open(self) -> None:
+        """
+        Map the pack file & load its index.
+        """
+        try:
+            with open(self.__filename, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # stays mapped after the file is closed
+        except (OSError, ValueError):
+            return
+
+        view = memoryview(mapped)
+        try:
+            magic, version, index_length = HEADER.unpack_from(view)
+            if magic != b'PACK' or version != FORMAT_VERSION:
+                return
+            index = json.loads(bytes(view[HEADER.size:HEADER.size + index_length]))
+        except (struct.error, ValueError):
+            return
+
+        # views of the mapped file keep it mapped (as long as anything made from it is used)
+        self.__data = view[_align(HEADER.size + index_length):]
+        self.__mixer = tuple(index['mixer'])
+        self.__entries = index['entries']
+
+    def __get_entry(self, kind: str, path: str):
+        """
+        Get index entry of an asset.
+        :param kind: "image" or "sound"
+        :param path: asset file
+        :return: index entry, or None if the asset is not in the pack (or changed after the pack was built)
+        """
+        entry = self.__get_entries().get(get_pack_name(path))
+        if entry is None or entry['kind'] != kind:
+            return None
+
+        try:
+            if int(getmtime(path)) != entry['mtime']:
+                return None
+        except OSError:
+            pass  # asset files are not shipped (only the pack)
+        return entry
+
+    def get_image(self, path: str):
+        """
+        Get image from the pack (made from the mapped pixels, without copying & decoding).
+        Image shares pixels with the pack, so it must be converted before it's changed or drawn.
+        :param path: image file
+        :return: image, or None if the image is not in the pack
+        """
+        entry = self.__get_entry('image', path)
+        if entry is None:
+            return None
+
+        pixels = self.__data[entry['offset']:entry['offset'] + entry['length']]
+        image = pg.image.frombuffer(pixels, tuple(entry['size']), entry['format'])
+        if entry['colorkey'] is not None:
+            image.set_colorkey(entry['colorkey'])
+        self.images += 1
+        return image
+
+    def get_sound(self, path: str):
+        """
+        Get sound from the pack (made from the mapped samples, without decoding).
+        :param path: sound file
+        :return: sound, or None if the sound is not in the pack (or the mixer format is different)
+        """
+        entry = self.__get_entry('sound', path)
+        if entry is None or self.__mixer != pg.mixer.get_init():
+            return None
+
+        self.sounds += 1
+        return pg.mixer.Sound(buffer=self.__data[entry['offset']:entry['offset'] + entry['length']])
+
+    def get_hash(self, path: str, mtime: float, size: int):
+        """
+        Get content hash of an asset file, saved when the pack was built (the file is not read).
+        :param path: asset file
+        :param mtime: file modification time
+        :param size: file size (bytes)
+        :return: content hash, or None if the asset is not in the pack (or changed after the pack was built)
+        """
+        entry = self.__get_entries().get(get_pack_name(path))
+        if entry is None or entry['mtime'] != int(mtime) or entry['sourceSize'] != size:
+            return None
+        return entry['hash']
+
+    def reset(self) -> None:
+        """
+        Forget the pack (it's mapped again on next use).
+        Assets made from the old pack keep it mapped until they're not used any more.
+        """
+        with self.__lock:
+            self.__entries = None
+            self.__data = None
+            self.__mixer = None
+
+    def get_stats(self) -> dict:
+        """
+        Get pack stats.
+        :return: dict with number of packed assets & number of images & sounds made from the pack
+        """
+        return {'assets': len(self.__get_entries()), 'images': self.images, 'sounds': self.sounds}
+
+
+# shared by all asset loaders
+asset_pack = AssetPack()
+
+
+def _find_files(directory: str, extensions: tuple, skip: str = None) -> list:
+    """
+    Find files with the extensions in the directory (& its subdirectories).
+    :param directory: directory to search
+    :param extensions: file extensions (lowercase)
+    :param skip: directory to skip
+    :return: sorted list of files
+    """
+    found = []
+    for root, _, files in walk(directory):
+        if skip is not None and not relpath(root, skip).startswith('..'):
+            continue
+        found.extend(join(root, file) for file in files if file.lower().endswith(extensions))
+    return sorted(found)
+
+
+def build_pack(filename: str = PACK_FILE) -> dict:
+    """
+    Pack all images & sound effects into one file: index followed by raw pixels & samples (in the mixer format).
+    Music is not packed (it's streamed), texture atlases are packed if they're built.
+    Old pack is replaced.
+    :param filename: pack file
+    :return: dict with number of packed images & sounds and pack size (bytes)
+    """
+    if not pg.mixer.get_init():
+        pg.mixer.init(*MIXER_SETTINGS)
+
+    entries = {}
+    payloads = []
+    offset = 0
+
+    def add(path: str, kind: str, data: bytes, **info) -> None:
+        nonlocal offset
+        padding = _align(offset) - offset
+        payloads.append(b'\0' * padding + data)
+        offset += padding
+
+        with open(path, 'rb') as f:
+            content_hash = sha1(f.read()).hexdigest()
+        entries[get_pack_name(path)] = dict(kind=kind, offset=offset, length=len(data), mtime=int(getmtime(path)),
+                                            sourceSize=getsize(path), hash=content_hash, **info)
+        offset += len(data)
+
+    images = _find_files(ASSETS_DIR, ('.png',)) + sorted(glob(join(ATLAS_DIR, 'atlas_*.png')))
+    for path in images:
+        image = pg.image.load(path)
+        alpha = bool(image.get_flags() & pg.SRCALPHA)
+        colorkey = image.get_colorkey()
+        image.set_colorkey(None)  # pixels are saved as they are
+        image_format = 'RGBA' if alpha else 'RGB'
+        add(path, 'image', pg.image.tostring(image, image_format), size=image.get_size(), format=image_format,
+            colorkey=list(colorkey[:3]) if colorkey is not None else None)
+
+    sounds = _find_files(ASSETS_DIR, ('.ogg', '.wav'), skip=MUSIC_DIR)
+    for path in sounds:
+        add(path, 'sound', pg.mixer.Sound(path).get_raw())
+
+    index = json.dumps({'mixer': pg.mixer.get_init(), 'entries': entries}).encode()
+    header = HEADER.pack(b'PACK', FORMAT_VERSION, len(index)) + index
+    header += b'\0' * (_align(len(header)) - len(header))
+
+    # write to a temporary file first (a half-written pack is never used)
+    with open(filename + '.tmp', 'wb') as f:
+        f.write(header)
+        for payload in payloads:
+            f.write(payload)
+    replace(filename + '.tmp', filename)
+
+    return {'images': len(images), 'sounds': len(sounds), 'size': len(header) + offset}
+
+
+if __name__ == '__main__':
+    stats = build_pack()
+    print(f'saved {PACK_FILE} ({stats["images"]} images, {stats["sounds"]} sounds, {stats["size"]} bytes)')
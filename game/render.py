@@ -0,0 +1,71 @@
+from . import pg
+from .config import WIDTH, HEIGHT
+from .tilemap import Camera
+from weakref import WeakKeyDictionary
+
+
+class ScaledRenderer:
+    """
+    Draws the world (map & sprites) at a lower internal resolution.
+    The world is scaled up to the game display once per frame, HUD & menus are drawn on the display (sharp).
+    """
+
+    def __init__(self, resolution: tuple):
+        """
+        Make the renderer.
+        :param resolution: internal render resolution (width, height)
+        """
+        self.resolution = tuple(resolution)
+        self.scale = self.resolution[0] / WIDTH
+        self.surface = pg.Surface(self.resolution).convert()
+
+        # scaled sprite images, dropped when the original image is not used any more
+        self.__images = WeakKeyDictionary()
+
+    def __get_image(self, image: pg.Surface) -> pg.Surface:
+        """
+        Get scaled image (scaled once).
+        :param image: original image
+        :return: scaled image
+        """
+        scaled = self.__images.get(image)
+        if scaled is None:
+            width = max(round(image.get_width() * self.scale), 1)
+            height = max(round(image.get_height() * self.scale), 1)
+            if image.get_bitsize() >= 24:
+                scaled = pg.transform.smoothscale(image, (width, height))
+            else:
+                scaled = pg.transform.scale(image, (width, height))
+            self.__images[image] = scaled
+        return scaled
+
+    def draw(self, images, camera: Camera) -> None:
+        """
+        Draw images on the render surface (in one batch).
+        :param images: sequence of (image, rect in map coordinates) or (image, rect, area of the image to draw)
+        :param camera: camera
+        """
+        scale = self.scale
+        get_image = self.__get_image
+        scale_rect = Camera.scale_rect
+
+        # camera offset (applied while making the batch)
+        x, y = camera.get_offset()
+        x = round(x * scale)
+        y = round(y * scale)
+
+        batch = []
+        for image in images:
+            rect = scale_rect(image[1], scale)
+            if len(image) == 3:
+                batch.append((get_image(image[0]), (rect.x + x, rect.y + y), scale_rect(image[2], scale)))
+            else:
+                batch.append((get_image(image[0]), (rect.x + x, rect.y + y)))
+        self.surface.blits(batch, doreturn=False)
+
+    def present(self, surface: pg.Surface) -> None:
+        """
+        Scale the render surface up to the display.
+        :param surface: surface to draw on (game display)
+        """
+        pg.transform.smoothscale(self.surface, (WIDTH, HEIGHT), surface)
@@ -0,0 +1,171 @@
+from . import pg
+from .config import GRID_CELL_SIZE
+
+
+class SpatialGrid:
+    """
+    Uniform grid spatial index.
+    Sprites are stored in every cell their rect overlaps, so only the cells around a rect have to be searched.
+    """
+
+    def __init__(self, cell_size: int = GRID_CELL_SIZE):
+        """
+        Make an empty grid.
+        :param cell_size: width & height of a single cell (px)
+        """
+        self.__cell_size = cell_size
+        self.__cells = {}  # (column, row) -> set of sprites
+        self.__sprite_cells = {}  # sprite -> (cells the sprite is in, rect the cells were computed from)
+
+    def __get_cells(self, rect: pg.Rect) -> tuple:
+        """
+        Get all cells a rect overlaps.
+        :param rect: rect in world (map) coordinates
+        :return: tuple of (column, row) cells
+        """
+        size = self.__cell_size
+        left = rect.left // size
+        top = rect.top // size
+        right = (rect.right - 1) // size
+        bottom = (rect.bottom - 1) // size
+        return tuple((column, row) for column in range(left, right + 1) for row in range(top, bottom + 1))
+
+    def insert(self, sprite: pg.sprite.Sprite) -> None:
+        """
+        Add a sprite to the grid.
+        :param sprite: sprite with a rect
+        """
+        rect = tuple(sprite.rect)
+        cells = self.__get_cells(sprite.rect)
+        for cell in cells:
+            self.__cells.setdefault(cell, set()).add(sprite)
+        self.__sprite_cells[sprite] = (cells, rect)
+
+    def remove(self, sprite: pg.sprite.Sprite) -> None:
+        """
+        Remove a sprite from the grid.
+        :param sprite: sprite to remove
+        """
+        cells, _ = self.__sprite_cells.pop(sprite, ((), None))
+        for cell in cells:
+            cell_sprites = self.__cells[cell]
+            cell_sprites.discard(sprite)
+            if not cell_sprites:
+                del self.__cells[cell]
+
+    def move(self, sprite: pg.sprite.Sprite) -> None:
+        """
+        Update sprite cells if its rect has changed since it was last indexed.
+        :param sprite: sprite to update
+        """
+        if sprite not in self.__sprite_cells:
+            self.insert(sprite)
+            return
+
+        cells, rect = self.__sprite_cells[sprite]
+        new_rect = tuple(sprite.rect)
+        if new_rect == rect:
+            return
+
+        new_cells = self.__get_cells(sprite.rect)
+        if new_cells != cells:
+            self.remove(sprite)
+            self.insert(sprite)
+        else:
+            self.__sprite_cells[sprite] = (cells, new_rect)
+
+    def query(self, rect: pg.Rect) -> set:
+        """
+        Get all sprites that overlap the rect.
+        :param rect: rect in world (map) coordinates
+        :return: set of sprites
+        """
+        found = set()
+        for cell in self.__get_cells(rect):
+            cell_sprites = self.__cells.get(cell)
+            if cell_sprites:
+                found.update(cell_sprites)
+        return {sprite for sprite in found if rect.colliderect(sprite.rect)}
+
+    def __len__(self) -> int:
+        """
+        Get number of indexed sprites.
+        :return: number of sprites
+        """
+        return len(self.__sprite_cells)
+
+
+class SpatialLayeredUpdates(pg.sprite.LayeredUpdates):
+    """
+    Layered sprite group that keeps a spatial grid of its sprites.
+    Used for drawing only the sprites that are inside the camera view.
+    Sprites that never move (obstacles, items...) are indexed only once,
+    sprites that move (their rect changes when they're updated) are re-indexed on every refresh.
+    """
+
+    def __init__(self, *sprites, **kwargs):
+        """
+        Make the group & the grid.
+        """
+        self.__grid = SpatialGrid()
+        self.__order = {}  # sprite -> insertion number (keeps draw order inside the same layer)
+        self.__counter = 0
+        self.__new = set()  # sprites not in the grid yet
+        self.__moving = set()  # sprites that moved at least once
+        pg.sprite.LayeredUpdates.__init__(self, *sprites, **kwargs)
+
+    def add_internal(self, sprite, layer=None) -> None:
+        """
+        Add sprite to the group.
+        Sprite is added to the grid on the next refresh (sprites are added to groups before their rect is made).
+        """
+        pg.sprite.LayeredUpdates.add_internal(self, sprite, layer)
+        self.__counter += 1
+        self.__order[sprite] = self.__counter
+        self.__new.add(sprite)
+
+    def remove_internal(self, sprite) -> None:
+        """
+        Remove sprite from the group & grid.
+        """
+        pg.sprite.LayeredUpdates.remove_internal(self, sprite)
+        self.__order.pop(sprite, None)
+        self.__new.discard(sprite)
+        self.__moving.discard(sprite)
+        self.__grid.remove(sprite)
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Update all sprites.
+        Sprites whose rect changes are re-indexed on every refresh from then on.
+        """
+        moving = self.__moving
+        order = self.__order
+        for sprite in self.sprites():
+            rect = tuple(sprite.rect)
+            sprite.update(*args, **kwargs)
+            if sprite not in moving and sprite in order and tuple(sprite.rect) != rect:
+                moving.add(sprite)
+
+    def refresh(self) -> None:
+        """
+        Index new sprites & re-index moving sprites (if they moved since the last refresh).
+        """
+        move = self.__grid.move
+        for sprite in self.__new:
+            move(sprite)
+        self.__new.clear()
+
+        for sprite in self.__moving:
+            move(sprite)
+
+    def get_visible(self, view_rect: pg.Rect) -> list:
+        """
+        Get sprites inside the view, in drawing order (by layer, then by the order they were added).
+        :param view_rect: camera view in world (map) coordinates
+        :return: list of visible sprites
+        """
+        self.refresh()
+        get_layer = self.get_layer_of_sprite
+        order = self.__order
+        return sorted(self.__grid.query(view_rect), key=lambda sprite: (get_layer(sprite), order[sprite]))
@@ -2,8 +2,8 @@ from . import pg, vec
 from .config import *
 from .images import *
 from .sounds import play_sound
+from .cache import asset_cache, get_mask
 
-from pygame.transform import flip, scale
 from random import randint, choice, random
 from itertools import chain
 from pytweening import easeInOutSine
@@ -75,6 +75,7 @@ class Player(pg.sprite.Sprite):
         self.__process_movement()
         self.__check_collisions()
         self.__check_gun_cool_down()
+        self.__recharge_gun()
 
         # player die
         if self.__health <= 0:
@@ -208,8 +209,8 @@ class Player(pg.sprite.Sprite):
         # set the position of sprite
         self.rect.midbottom = self.__pos  # fix the bug where the player disappears
 
-        # for precise collisions
-        self.mask = pg.mask.from_surface(self.image)
+        # for precise collisions (every frame's mask is made once)
+        self.mask = get_mask(self.image)
 
     # ===== Load player data =====
     def __load_data(self) -> None:
@@ -225,41 +226,33 @@ class Player(pg.sprite.Sprite):
         """
         Load all player related images.
         """
-        # access player sprite sheet
-        load_img = self.game.player_sprite_sheet.parse_sprite
+        # access player sprite sheet (frames are parsed & flipped only once)
+        get_animation = self.game.player_sprite_sheet.get_animation
 
         # idle
-        self.__idle_frames_right = [load_img('idle_{}.png'.format(i)) for i in range(10)]
-        self.__idle_frames_left = [flip(img, True, False) for img in self.__idle_frames_right]
+        self.__idle_frames_right, self.__idle_frames_left = get_animation('idle', 10)
 
         # jump
-        self.__jump_frames_right = [load_img('jump_{}.png'.format(i)) for i in range(10)]
-        self.__jump_frames_left = [flip(img, True, False) for img in self.__jump_frames_right]
+        self.__jump_frames_right, self.__jump_frames_left = get_animation('jump', 10)
 
         # falling
-        self.__falling_frames_right = [self.__jump_frames_right[6], self.__jump_frames_right[7],
-                                       self.__jump_frames_right[8]]
-        self.__falling_frames_left = [flip(img, True, False) for img in self.__falling_frames_right]
+        self.__falling_frames_right = self.__jump_frames_right[6:9]
+        self.__falling_frames_left = self.__jump_frames_left[6:9]
 
         # jump shoot
-        self.__jump_shoot_frames_right = [load_img('jump_shoot_{}.png'.format(i)) for i in range(5)]
-        self.__jump_shoot_frames_left = [flip(img, True, False) for img in self.__jump_shoot_frames_right]
+        self.__jump_shoot_frames_right, self.__jump_shoot_frames_left = get_animation('jump_shoot', 5)
 
         # run
-        self.__run_frames_right = [load_img('run_{}.png'.format(i)) for i in range(8)]
-        self.__run_frames_left = [flip(img, True, False) for img in self.__run_frames_right]
+        self.__run_frames_right, self.__run_frames_left = get_animation('run', 8)
 
         # run shoot
-        self.__run_shoot_frames_right = [load_img('run_shoot_{}.png'.format(i)) for i in range(9)]
-        self.__run_shoot_frames_left = [flip(img, True, False) for img in self.__run_shoot_frames_right]
+        self.__run_shoot_frames_right, self.__run_shoot_frames_left = get_animation('run_shoot', 9)
 
         # shooting
-        self.__shooting_frames_right = [load_img('shoot_{}.png'.format(i)) for i in range(4)]
-        self.__shooting_frames_left = [flip(img, True, False) for img in self.__shooting_frames_right]
+        self.__shooting_frames_right, self.__shooting_frames_left = get_animation('shoot', 4)
 
         # sliding
-        self.__sliding_frames_right = [load_img('slide_{}.png'.format(i)) for i in range(10)]
-        self.__sliding_frames_left = [flip(img, True, False) for img in self.__sliding_frames_right]
+        self.__sliding_frames_right, self.__sliding_frames_left = get_animation('slide', 10)
 
     def __load_sounds(self) -> None:
         """
@@ -284,6 +277,13 @@ class Player(pg.sprite.Sprite):
         self.__coin_pickup_sound = self.main_menu.coin_pickup_sound
         self.__key_pickup_sound = self.main_menu.key_pickup_sound
 
+    def apply_settings(self) -> None:
+        """
+        Load changed controls & sounds settings (used right away).
+        """
+        self.__load_controls()
+        self.__load_sounds()
+
     def __load_controls(self) -> None:
         """
         Load controls from main menu (settings.json) and convert them to integer (unicode).
@@ -475,6 +475,23 @@ class Player(pg.sprite.Sprite):
         else:
             self.__can_shoot = False
 
+    def __recharge_gun(self) -> None:
+        """
+        Increase (reset) gun cool down, between 0 and max.
+        """
+        self.__gun_cool_down += GUN_COOL_DOWN_INCREASE_SPEED
+        if self.__gun_cool_down <= 0:  # prevent from going below 0
+            self.__gun_cool_down = 0
+        elif self.__gun_cool_down >= GUN_COOL_DOWN:  # prevent from going above max
+            self.__gun_cool_down = GUN_COOL_DOWN
+
+    def get_gun_cool_down(self) -> float:
+        """
+        Get gun cool down.
+        :return: gun cool down
+        """
+        return self.__gun_cool_down
+
     def __stop_shooting(self) -> None:
         """
         Stop shooting.
@@ -803,115 +820,13 @@ class Player(pg.sprite.Sprite):
                     self.__has_key = False
 
     # drawing
-    def draw_health(self) -> None:
-        """
-        Draw player health bar.
-        """
-        health_icon = scale(pg.image.load(HEALTH_PACK_IMAGE), (27, 27)).convert_alpha()
-
-        surface = self.game.display
-
-        x = WIDTH / 2 - 720
-        y = HEIGHT / 2 - 420
-
-        percentage = self.__health / PLAYER_HEALTH  # health percentage
-
-        # don't go below 0
-        if percentage < 0:
-            percentage = 0
-
-        bar_width = 100
-        bar_height = 20
-        fill_width = percentage * bar_width
-
-        outline_rect = pg.Rect(x, y, bar_width, bar_height)
-        filled_rect = pg.Rect(x, y, fill_width, bar_height)
-
-        # color
-        if percentage >= 0.6:
-            color = GREEN
-        elif percentage >= 0.3:
-            color = YELLOW
-        else:
-            color = RED
-
-        # drawing
-        surface.blit(health_icon, (x - 35, y - 5))  # health icon next to health bar
-        pg.draw.rect(surface, DARK_GREY, outline_rect)  # fix drawing bug (color below health color)
-        pg.draw.rect(surface, color, filled_rect)  # filled rect (health color)
-        pg.draw.rect(surface, color, outline_rect, 2)  # outline rect
-
-    def draw_gun_bar(self) -> None:
-        """
-        Draw player gun cool down bar.
-        """
-        bullet_icon = scale(pg.image.load(BULLET_ICON), (27, 27)).convert_alpha()
-
-        surface = self.game.display
-
-        # adjust drawing position
-        if self.main_menu.health_on:
-            offset = 380
-        else:
-            offset = 420
-        x = WIDTH / 2 - 720
-        y = HEIGHT / 2 - offset
-
-        percentage = self.__gun_cool_down / 100  # gun fill percentage
-
-        self.__gun_cool_down += GUN_COOL_DOWN_INCREASE_SPEED  # increase (reset) gun cool down
-        if self.__gun_cool_down <= 0:  # prevent from going below 0
-            self.__gun_cool_down = 0
-        elif self.__gun_cool_down >= GUN_COOL_DOWN:  # prevent from going above max
-            self.__gun_cool_down = GUN_COOL_DOWN
-
-        bar_width = 100
-        bar_height = 20
-        fill_width = percentage * bar_width
-
-        outline_rect = pg.Rect(x, y, bar_width, bar_height)
-        filled_rect = pg.Rect(x, y, fill_width, bar_height)
-
-        # color
-        if percentage >= 0.6:
-            color = GREEN
-        elif percentage >= 0.3:
-            color = YELLOW
-        else:
-            color = RED
-
-        # drawing
-        surface.blit(bullet_icon, (x - 35, y - 5))  # draw health icon next to health bar
-        pg.draw.rect(surface, DARK_GREY, outline_rect)  # fix drawing bug (color below health color)
-        pg.draw.rect(surface, color, filled_rect)  # filled rect (gun cool down color)
-        pg.draw.rect(surface, color, outline_rect, 2)  # outline rect (fixed)
-
-    def draw_score(self) -> None:
-        """
-        Draw player score on screen.
-        """
-        health_on = self.main_menu.health_on
-        gun_bar_on = self.main_menu.gun_bar_on
-
-        # adjust drawing position
-        if health_on and gun_bar_on:  # all on
-            offset = 350
-        elif health_on and not gun_bar_on or not health_on and gun_bar_on:  # only one on
-            offset = 390
-        else:  # all off
-            offset = 430
-        x = WIDTH / 2 - 750
-        y = HEIGHT / 2 - offset
-
-        font = pg.font.Font(FONT, 25)
-        score_text = font.render(f'Score: {str(self.__score)}', True, WHITE)
-        self.game.display.blit(score_text, (x, y))
-
     def acid_damage_alpha(self) -> None:
         """
         Apply acid damage color on player.
+        Tinted on a copy, the player image is a shared animation frame.
         """
         damage_alpha = chain(DAMAGE_ALPHA)
+        self.image = self.image.copy()
         self.image.fill((255, 0, 0, next(damage_alpha)), special_flags=pg.BLEND_RGBA_MULT)
 
 
@@ -935,13 +850,15 @@ class Bullet(pg.sprite.Sprite):
         # player reference
         self.__player = self.game.player
 
+        # movement direction
+        self.__direction = direction
+
         # image
         self.__load_images()
         self.image = self.__images[0]
         self.rect = self.image.get_rect()
 
         # movement
-        self.__direction = direction
         self.__pos = vec(pos)
         self.__vel = self.__direction * BULLET_SPEED
         self.rect.center = pos
@@ -955,7 +872,7 @@ class Bullet(pg.sprite.Sprite):
         self.__gun_upgrade_on = self.game.main_menu.gun_upgrade_on
         self.__adjust_bullet_damage()
 
-        self.mask = pg.mask.from_surface(self.image)
+        self.mask = get_mask(self.image)
 
     def update(self) -> None:
         """
@@ -968,11 +885,20 @@ class Bullet(pg.sprite.Sprite):
 
     def __load_images(self) -> None:
         """
-        Parse bullet images from player sprite sheet.
+        Get bullet images (already flipped for the bullet direction).
+        """
+        if self.__direction == vec(1, 0):
+            self.__images = self.game.effect_frames.bullet_right
+        else:
+            self.__images = self.game.effect_frames.bullet_left
+
+    def apply_settings(self) -> None:
+        """
+        Apply changed gun upgrade setting (bullet damage).
         """
-        self.__images = [self.game.player_sprite_sheet.parse_sprite('bullet_{}.png'.format(i)) for i in range(5)]
-        self.__images = [scale(img, (int(img.get_width() // 1.5), int(img.get_height() // 1.5))) for img in
-                         self.__images]
+        if self.game.main_menu.gun_upgrade_on != self.__gun_upgrade_on:
+            self.__gun_upgrade_on = self.game.main_menu.gun_upgrade_on
+            self.__adjust_bullet_damage()
 
     def __adjust_bullet_damage(self) -> None:
         """
@@ -1004,10 +930,7 @@ class Bullet(pg.sprite.Sprite):
         if now - self.__last_update > 30:
             self.__last_update = now
             self.__current_frame = (self.__current_frame + 1) % len(self.__images)
-            if self.__direction == vec(1, 0):
-                self.image = self.__images[self.__current_frame]
-            else:
-                self.image = flip(self.__images[self.__current_frame], True, False)
+            self.image = self.__images[self.__current_frame]
             self.rect = self.image.get_rect()
 
     def __move(self) -> None:
@@ -1118,6 +1041,8 @@ class Zombie(pg.sprite.Sprite):
     Zombie position is set in Tiled editor.
     """
 
+    health_bars = {}  # pre-rendered health bars (shared by all zombies), (fill width, color) -> bar image
+
     def __init__(self, game, x: float, y: float):
         """
         Make a zombie.
@@ -1148,6 +1073,7 @@ class Zombie(pg.sprite.Sprite):
 
         self.__health = ZOMBIE_HEALTH
         self.__damage = ZOMBIE_DAMAGE
+        self.__set_health_bar()
 
         # animations
         self.__FACING_RIGHT = True
@@ -1234,26 +1160,24 @@ class Zombie(pg.sprite.Sprite):
 
         self.rect.midbottom = self.__pos
 
-        # for precise collisions
-        self.mask = pg.mask.from_surface(self.image)
+        # for precise collisions (every frame's mask is made once)
+        self.mask = get_mask(self.image)
 
     def __load_data(self) -> None:
         """
         Load zombie sprite images & sounds.
         """
-        load_img = self.game.zombies_sprite_sheet.parse_sprite
+        # frames are shared by all zombies (parsed & flipped only once)
+        get_animation = self.game.zombies_sprite_sheet.get_animation
 
         # attack
-        self.__attack_frames_right = [load_img('attack_{}.png'.format(i)) for i in range(8)]
-        self.__attack_frames_left = [flip(img, True, False) for img in self.__attack_frames_right]
+        self.__attack_frames_right, self.__attack_frames_left = get_animation('attack', 8)
 
         # idle
-        self.__idle_frames_right = [load_img('idle_{}.png'.format(i)) for i in range(15)]
-        self.__idle_frames_left = [flip(img, True, False) for img in self.__idle_frames_right]
+        self.__idle_frames_right, self.__idle_frames_left = get_animation('idle', 15)
 
         # walk
-        self.__walk_frames_right = [load_img('walk_{}.png'.format(i)) for i in range(10)]
-        self.__walk_frames_left = [flip(img, True, False) for img in self.__walk_frames_right]
+        self.__walk_frames_right, self.__walk_frames_left = get_animation('walk', 10)
 
         # sound settings
         self.__hit_sound_on = self.main_menu.zombie_hit_sound_on
@@ -1301,6 +1225,7 @@ class Zombie(pg.sprite.Sprite):
         :param damage: damage amount
         """
         self.__health -= damage
+        self.__set_health_bar()
 
     def __kill(self) -> None:
         """
@@ -1532,12 +1457,11 @@ class Zombie(pg.sprite.Sprite):
                 self.rect.bottom = self.__pos.y + 1  # set zombie's bottom to that position
 
     # drawing
-    def draw_health(self) -> None:
+    def __set_health_bar(self) -> None:
         """
-        Draw zombie health bar.
+        Set zombie health bar image (when health changes).
+        Bars are bucketed by fill width (px), each bar is rendered only once.
         """
-        surface = self.image
-
         percentage = self.__health / ZOMBIE_HEALTH  # health percentage
 
         # don't go below 0
@@ -1546,10 +1470,7 @@ class Zombie(pg.sprite.Sprite):
 
         bar_width = 54
         bar_height = 7
-        fill_width = percentage * bar_width
-
-        outline_rect = pg.Rect(0, 0, bar_width, bar_height)
-        filled_rect = pg.Rect(0, 0, fill_width, bar_height)
+        fill_width = int(percentage * bar_width)
 
         # color
         if percentage >= 0.6:
@@ -1559,9 +1480,18 @@ class Zombie(pg.sprite.Sprite):
         else:
             color = RED
 
-        # drawing
-        pg.draw.rect(surface, DARK_GREY, outline_rect)
-        pg.draw.rect(surface, color, filled_rect)
+        key = (fill_width, color)
+        if key not in Zombie.health_bars:
+            outline_rect = pg.Rect(0, 0, bar_width, bar_height)
+            filled_rect = pg.Rect(0, 0, fill_width, bar_height)
+
+            # drawing
+            bar = pg.Surface(outline_rect.size).convert()
+            pg.draw.rect(bar, DARK_GREY, outline_rect)
+            pg.draw.rect(bar, color, filled_rect)
+            Zombie.health_bars[key] = bar
+
+        self.health_bar = Zombie.health_bars[key]
 
 
 # effects
@@ -1583,8 +1513,7 @@ class MuzzleFlash(pg.sprite.Sprite):
         self.game = game
 
         # image
-        self.__images = [self.game.player_sprite_sheet.parse_sprite('muzzle_{}.png'.format(i)) for i in range(5)]
-        self.__images = [scale(img, (int(img.get_width() * 2), int(img.get_height() * 1.2))) for img in self.__images]
+        self.__images = self.game.effect_frames.muzzle_flash
         self.image = self.__images[0]
         self.rect = self.image.get_rect()
 
@@ -1632,8 +1561,7 @@ class Explosion(pg.sprite.Sprite):
         self.__player = player
 
         # image
-        self.__images = [self.game.explosion_sprite_sheet.parse_sprite('explosion_{}.png'.format(i)) for i in range(9)]
-        self.__images = [scale(img, (int(img.get_width() // 2), int(img.get_height() // 2))) for img in self.__images]
+        self.__images = self.game.effect_frames.explosion
         self.image = self.__images[0]
         self.rect = self.image.get_rect()
 
@@ -1707,19 +1635,10 @@ class Splat(pg.sprite.Sprite):
         self.game = game
 
         # image
-        self.__load_images()
-        self.image = choice(self.__images)  # random image
+        self.image = choice(self.game.effect_frames.splat)  # random image
         self.rect = self.image.get_rect()
         self.rect.center = pos + (25, -30)
 
-    def __load_images(self):
-        """
-        Load splat images.
-        """
-        self.__images = [pg.image.load(img) for img in SPLAT_IMAGES]
-        self.__images = [scale(img, (int(img.get_width() // 2.5), int(img.get_height() // 2.5))) for img in
-                         self.__images]
-
 
 # hazards
 class Acid(pg.sprite.Sprite):
@@ -1827,6 +1746,7 @@ class Saw(pg.sprite.Sprite):
         # image
         self.__load_images()
         self.image = self.__images[0]
+        self.mask = self.__images.get_mask(0)  # for precise collisions (made with the frame)
         self.rect = self.image.get_rect(center=(x, y))
 
         # adjust position by the offset
@@ -1862,16 +1782,11 @@ class Saw(pg.sprite.Sprite):
 
     def __load_images(self) -> None:
         """
-        Load saw sprite image and make images by rotating it.
+        Load saw rotation frames.
+        Frames are shared by all saws of the same size & made only when used.
         """
-        image = pg.image.load(SAW_IMAGE).convert_alpha()
-        image = scale(image, (int(self.__width), int(self.__height)))
-        image.set_colorkey(BLACK)
-        rot = 0
-        self.__images = []
-        for i in range(360):
-            self.__images.append(pg.transform.rotozoom(image, rot, 1))  # prevent rotating the background
-            rot += 1
+        self.__images = asset_cache.load_rotations(SAW_IMAGE, (self.__width, self.__height), SAW_ROTATION_STEP,
+                                                   BLACK, SAW_FRAMES_DISK_CACHE)
 
     def __set_saw_type(self) -> None:
         """
@@ -1949,8 +1864,6 @@ class Saw(pg.sprite.Sprite):
         # rotating animation
         self.__rotate()
 
-        self.mask = pg.mask.from_surface(self.image)
-
     def __rotate(self) -> None:
         """
         Rotate the saw.
@@ -1958,8 +1871,9 @@ class Saw(pg.sprite.Sprite):
         now = pg.time.get_ticks()
         if now - self.__last_rot > 30:
             self.__last_rot = now
-            self.__current_frame = (self.__current_frame + 15) % len(self.__images)
+            self.__current_frame = (self.__current_frame + 1) % len(self.__images)
             self.image = self.__images[self.__current_frame]
+            self.mask = self.__images.get_mask(self.__current_frame)
             self.rect = self.image.get_rect(center=(self.__x, self.__y))
 
     def __move(self) -> None:
@@ -2085,17 +1999,17 @@ class LaserMachine(pg.sprite.Sprite):
         """
         Load laser machine images.
         """
-        load_img = pg.image.load
+        load_img = asset_cache.load
 
         scale_factor = (int(self.__width), int(self.__height))
 
-        # load images
-        laser_down_shoot_image = scale(load_img(LASER_MACHINE_DOWN_SHOOT_IMAGE), scale_factor).convert_alpha()
-        laser_down_off_image = scale(load_img(LASER_MACHINE_DOWN_OFF_IMAGE), scale_factor).convert_alpha()
-        laser_right_shoot_image = scale(load_img(LASER_MACHINE_RIGHT_SHOOT_IMAGE), scale_factor).convert_alpha()
-        laser_right_off_image = scale(load_img(LASER_MACHINE_RIGHT_OFF_IMAGE), scale_factor).convert_alpha()
-        laser_left_shoot_image = scale(load_img(LASER_MACHINE_LEFT_SHOOT_IMAGE), scale_factor).convert_alpha()
-        laser_left_off_image = scale(load_img(LASER_MACHINE_LEFT_OFF_IMAGE), scale_factor).convert_alpha()
+        # load images (shared)
+        laser_down_shoot_image = load_img(LASER_MACHINE_DOWN_SHOOT_IMAGE, scale_factor)
+        laser_down_off_image = load_img(LASER_MACHINE_DOWN_OFF_IMAGE, scale_factor)
+        laser_right_shoot_image = load_img(LASER_MACHINE_RIGHT_SHOOT_IMAGE, scale_factor)
+        laser_right_off_image = load_img(LASER_MACHINE_RIGHT_OFF_IMAGE, scale_factor)
+        laser_left_shoot_image = load_img(LASER_MACHINE_LEFT_SHOOT_IMAGE, scale_factor)
+        laser_left_off_image = load_img(LASER_MACHINE_LEFT_OFF_IMAGE, scale_factor)
 
         # down
         self.__laser_down_shoot = laser_down_shoot_image
@@ -2212,7 +2126,7 @@ class LaserBullet(pg.sprite.Sprite):
         self.__pos = vec(pos) + offset
 
         # image
-        self.image = pg.image.load(LASER_BULLET_IMAGE).convert_alpha()
+        self.image = self.game.effect_frames.laser_bullet
         self.rect = self.image.get_rect()
         self.rect.center = self.__pos
 
@@ -2224,7 +2138,7 @@ class LaserBullet(pg.sprite.Sprite):
 
         self.__damage = LASER_BULLET_DAMAGE
 
-        self.mask = pg.mask.from_surface(self.image)
+        self.mask = get_mask(self.image)
 
     def update(self) -> None:
         """
@@ -2349,7 +2263,7 @@ class LaserBeam(pg.sprite.Sprite):
                     self.image = self.yellow_laser
                     self.__adjust_position(self.image)
 
-        self.mask = pg.mask.from_surface(self.image)
+        self.mask = get_mask(self.image)
 
     def __adjust_position(self, image: pg.Surface) -> None:
         """
@@ -2376,23 +2290,17 @@ class LaserBeam(pg.sprite.Sprite):
         """
         Load laser beam images.
         """
-        load_img = pg.image.load
+        load_img = asset_cache.load
 
         # scale factor values
         scale_vertical = (int(self.__width * 12), int(self.__height + 4))
         scale_horizontal = (int(self.__height + 6), int(self.__width * 12))
 
-        # load images
-        red_img = load_img(RED_LASER_IMAGE).convert_alpha()
-        blue_img = load_img(BLUE_LASER_IMAGE).convert_alpha()
-        green_img = load_img(GREEN_LASER_IMAGE).convert_alpha()
-        yellow_img = load_img(YELLOW_LASER_IMAGE).convert_alpha()
-
-        # scale images
-        self.red_laser = scale(red_img, scale_vertical)
-        self.blue_laser = scale(blue_img, scale_vertical)
-        self.green_laser = scale(green_img, scale_horizontal)
-        self.yellow_laser = scale(yellow_img, scale_horizontal)
+        # load & scale images (shared)
+        self.red_laser = load_img(RED_LASER_IMAGE, scale_vertical)
+        self.blue_laser = load_img(BLUE_LASER_IMAGE, scale_vertical)
+        self.green_laser = load_img(GREEN_LASER_IMAGE, scale_horizontal)
+        self.yellow_laser = load_img(YELLOW_LASER_IMAGE, scale_horizontal)
 
     def get_type(self) -> str:
         """
@@ -2438,12 +2346,11 @@ class LaserReceiver(pg.sprite.Sprite):
         """
         Make laser receiver.
         """
-        # load image
-        receiver_img = pg.image.load(LASER_RECEIVER_IMAGE)
-
-        down_image = scale(receiver_img, (int(self.__width), int(self.__height))).convert_alpha()
-        right_image = pg.transform.rotate(down_image, 90)
-        left_image = pg.transform.rotate(down_image, 270)
+        # load images (shared)
+        size = (int(self.__width), int(self.__height))
+        down_image = asset_cache.load(LASER_RECEIVER_IMAGE, size)
+        right_image = asset_cache.load(LASER_RECEIVER_IMAGE, size, angle=90)
+        left_image = asset_cache.load(LASER_RECEIVER_IMAGE, size, angle=270)
 
         # set image (based on type)
         if self.__type == 'down':
@@ -2456,7 +2363,7 @@ class LaserReceiver(pg.sprite.Sprite):
             self.image = right_image
             self.__adjust_image(self.image, -12)
 
-        self.mask = pg.mask.from_surface(self.image)
+        self.mask = get_mask(self.image)
 
     def __adjust_image(self, image: pg.Surface, offset_x: int = 0, offset_y: int = 0) -> None:
         """
@@ -2501,7 +2408,6 @@ class DoorSwitch(pg.sprite.Sprite):
         # image
         self.__load_images()
         self.image = self.__disabled_img
-        self.image.set_colorkey(BLACK)
         self.rect = self.image.get_rect(center=(x, y))
         self.rect.x = x
         self.rect.y = y
@@ -2519,13 +2425,9 @@ class DoorSwitch(pg.sprite.Sprite):
         """
         scale_factor = (int(self.__width), int(self.__height))
 
-        # load images
-        disabled_img = pg.image.load(DOOR_SWITCH_DISABLED_IMAGE).convert()
-        enabled_img = pg.image.load(DOOR_SWITCH_ENABLED_IMAGE).convert()
-
-        # set images
-        self.__disabled_img = scale(disabled_img, scale_factor)
-        self.__enabled_img = scale(enabled_img, scale_factor)
+        # load & scale images (shared)
+        self.__disabled_img = asset_cache.load(DOOR_SWITCH_DISABLED_IMAGE, scale_factor, alpha=False, colorkey=BLACK)
+        self.__enabled_img = asset_cache.load(DOOR_SWITCH_ENABLED_IMAGE, scale_factor, alpha=False)
 
     def update(self) -> None:
         """
@@ -2597,7 +2499,6 @@ class Door(pg.sprite.Sprite):
         # image
         self.__load_images()
         self.image = self.__locked_img
-        self.image.set_colorkey(BLACK)
         self.rect = self.image.get_rect(center=(x, y))
         self.rect.x = x
         self.rect.y = y
@@ -2613,18 +2514,13 @@ class Door(pg.sprite.Sprite):
         """
         Load door images.
         """
-        load_img = pg.image.load
+        load_img = asset_cache.load
         scale_by = (int(self.__width), int(self.__height))
 
-        # load images
-        locked_img = load_img(DOOR_LOCKED_IMAGE).convert()
-        unlocked_img = load_img(DOOR_UNLOCKED_IMAGE).convert()
-        opened_img = load_img(DOOR_OPEN_IMAGE).convert()
-
-        # set images
-        self.__locked_img = scale(locked_img, scale_by)
-        self.__unlocked_img = scale(unlocked_img, scale_by)
-        self.__opened_img = scale(opened_img, scale_by)
+        # load & scale images (shared)
+        self.__locked_img = load_img(DOOR_LOCKED_IMAGE, scale_by, alpha=False, colorkey=BLACK)
+        self.__unlocked_img = load_img(DOOR_UNLOCKED_IMAGE, scale_by, alpha=False)
+        self.__opened_img = load_img(DOOR_OPEN_IMAGE, scale_by, alpha=False)
 
     def update(self) -> None:
         """
@@ -2713,7 +2609,7 @@ class Lever(pg.sprite.Sprite):
         self.rect.x = x
         self.rect.y = y
 
-        self.mask = pg.mask.from_surface(self.image)
+        self.mask = get_mask(self.image)
 
         # load sounds
         self.__pull_sound_on = game.main_menu.lever_pull_sound_on
@@ -2754,28 +2650,18 @@ class Lever(pg.sprite.Sprite):
         """
         Load lever images.
         """
-        load_img = pg.image.load
+        load_img = asset_cache.load
         scale_factor = (int(self.__width), int(self.__height))
 
-        # load images
-        blue_lever_on = load_img(BLUE_LEVER_ON_IMAGE).convert_alpha()
-        blue_lever_off = load_img(BLUE_LEVER_OFF_IMAGE).convert_alpha()
-        red_lever_on = load_img(RED_LEVER_ON_IMAGE).convert_alpha()
-        red_lever_off = load_img(RED_LEVER_OFF_IMAGE).convert_alpha()
-        green_lever_on = load_img(GREEN_LEVER_ON_IMAGE).convert_alpha()
-        green_lever_off = load_img(GREEN_LEVER_OFF_IMAGE).convert_alpha()
-        yellow_lever_on = load_img(YELLOW_LEVER_ON_IMAGE).convert_alpha()
-        yellow_lever_off = load_img(YELLOW_LEVER_OFF_IMAGE).convert_alpha()
-
-        # set images
-        self.__blue_lever_on_img = scale(blue_lever_on, scale_factor)
-        self.__blue_lever_off_img = scale(blue_lever_off, scale_factor)
-        self.__red_lever_on_img = scale(red_lever_on, scale_factor)
-        self.__red_lever_off_img = scale(red_lever_off, scale_factor)
-        self.__green_lever_on_img = scale(green_lever_on, scale_factor)
-        self.__green_lever_off_img = scale(green_lever_off, scale_factor)
-        self.__yellow_lever_on_img = scale(yellow_lever_on, scale_factor)
-        self.__yellow_lever_off_img = scale(yellow_lever_off, scale_factor)
+        # load & scale images (shared)
+        self.__blue_lever_on_img = load_img(BLUE_LEVER_ON_IMAGE, scale_factor)
+        self.__blue_lever_off_img = load_img(BLUE_LEVER_OFF_IMAGE, scale_factor)
+        self.__red_lever_on_img = load_img(RED_LEVER_ON_IMAGE, scale_factor)
+        self.__red_lever_off_img = load_img(RED_LEVER_OFF_IMAGE, scale_factor)
+        self.__green_lever_on_img = load_img(GREEN_LEVER_ON_IMAGE, scale_factor)
+        self.__green_lever_off_img = load_img(GREEN_LEVER_OFF_IMAGE, scale_factor)
+        self.__yellow_lever_on_img = load_img(YELLOW_LEVER_ON_IMAGE, scale_factor)
+        self.__yellow_lever_off_img = load_img(YELLOW_LEVER_OFF_IMAGE, scale_factor)
 
     def __set_off_image(self) -> None:
         """
@@ -2911,23 +2797,27 @@ class Item(pg.sprite.Sprite):
         elif self.__type == 'key':
             self.image = self.__key_img
 
-        self.mask = pg.mask.from_surface(self.image)
+        self.mask = get_mask(self.image)
 
     def __load_images(self) -> None:
         """
         Load items images.
         """
-        load_img = pg.image.load
+        load_img = asset_cache.load
 
+        # only the images for this item type are loaded (shared by all items)
         # health pack
-        self.__health_pack_image = scale(load_img(HEALTH_PACK_IMAGE), (22, 22)).convert_alpha()
+        if self.__type == 'health':
+            self.__health_pack_image = load_img(HEALTH_PACK_IMAGE, (22, 22))
         # xp
-        self.__xp_image = load_img(XP_IMAGE).convert_alpha()
+        elif self.__type == 'xp':
+            self.__xp_image = load_img(XP_IMAGE)
         # coin
-        self.__coins = [load_img(img).convert_alpha() for img in COIN_IMAGES]
-        self.__coin_images = [scale(img, (20, 20)) for img in self.__coins]
+        elif self.__type == 'coin':
+            self.__coin_images = [load_img(img, (20, 20)) for img in COIN_IMAGES]
         # key
-        self.__key_img = scale(load_img(KEY_IMAGE), (22, 22)).convert_alpha()
+        elif self.__type == 'key':
+            self.__key_img = load_img(KEY_IMAGE, (22, 22))
 
     def get_type(self) -> str:
         """
@@ -1,11 +1,17 @@
 from . import pg
 from .config import BLACK
+from .surface_cache import surface_cache
+from .loader import asset_loader
+from .cache import get_mask, replace_image
+from os.path import normpath
 import json
 
 
 class SpriteSheet:
     """
     Utility class for loading and parsing sprite sheets.
+    Parsed sprites (& their flipped copies) are kept, so every sprite is parsed & scaled only once.
+    Sprite sheet image is loaded only when a sprite is not in the disk cache.
     """
 
     def __init__(self, filename: str, is_sprite: bool = False):
@@ -16,13 +22,20 @@ class SpriteSheet:
         """
         self.__is_sprite = is_sprite
 
-        self.__sprite_sheet = pg.image.load(filename).convert()
+        self.__filename = filename
+        self.__sprite_sheet = None  # loaded on first use
 
         # load data
         self.__meta_data = filename.replace('png', 'json')  # change .png to .json (because the name is the same)
         with open(self.__meta_data) as f:
             self.__data = json.load(f)  # converts data from the json file into python dictionary
 
+        # parsed sprites (sheet scale is the same for every sprite, so the name is enough)
+        self.__sprites = {}  # name -> sprite image
+        self.__flipped_sprites = {}  # name -> flipped sprite image
+        self.__animations = {}  # (name, frames) -> (right frames, left frames)
+        self.__made = {}  # params -> (make function, images made from the sheet), for reloading
+
     def __get_sprite(self, x: int, y: int, width: int, height: int) -> pg.Surface:
         """
         Get sprite image.
@@ -32,6 +45,9 @@ class SpriteSheet:
         :param height: height from .json file
         :return: pygame surface (sprite image)
         """
+        if self.__sprite_sheet is None:
+            self.__sprite_sheet = asset_loader.get_image(self.__filename).convert()  # decoded in background
+
         sprite = pg.Surface((width, height))
         sprite.set_colorkey(BLACK)
         sprite.blit(self.__sprite_sheet, (0, 0), (x, y, width, height))
@@ -46,10 +62,112 @@ class SpriteSheet:
 
     def parse_sprite(self, name: str) -> pg.Surface:
         """
-        Parse the sprite.
+        Parse the sprite (parsed only the first time, then the same image is returned).
+        Returned image is shared, so it must not be changed.
         :param name: name of the sprite image in .json file
         :return: pygame surface (sprite image)
         """
-        sprite = self.__data['frames'][name]['frame']
-        x, y, width, height = sprite['x'], sprite['y'], sprite['w'], sprite['h']
+        sprite = self.__sprites.get(name)
+        if sprite is None:
+            sprite = self.__parse(name)
+            self.__sprites[name] = sprite
+        return sprite
+
+    def __parse(self, name: str) -> pg.Surface:
+        """
+        Parse the sprite from the sprite sheet.
+        :param name: name of the sprite image in .json file
+        :return: pygame surface (sprite image)
+        """
+        frame = self.__data['frames'][name]['frame']
+        x, y, width, height = frame['x'], frame['y'], frame['w'], frame['h']
         return self.__get_sprite(x, y, width, height)
+
+    def parse_flipped_sprite(self, name: str) -> pg.Surface:
+        """
+        Parse the sprite flipped horizontally (flipped only the first time).
+        Returned image is shared, so it must not be changed.
+        :param name: name of the sprite image in .json file
+        :return: pygame surface (flipped sprite image)
+        """
+        sprite = self.__flipped_sprites.get(name)
+        if sprite is None:
+            sprite = pg.transform.flip(self.parse_sprite(name), True, False)
+            self.__flipped_sprites[name] = sprite
+        return sprite
+
+    def get_animation(self, name: str, frames: int) -> tuple:
+        """
+        Get animation frames facing right & left (sprites named "name_0.png", "name_1.png"...).
+        Frames are shared by everyone using the same sprite sheet, so they must not be changed.
+        :param name: animation name
+        :param frames: number of frames
+        :return: (frames facing right, frames facing left)
+        """
+        key = (name, frames)
+        animation = self.__animations.get(key)
+        if animation is None:
+            names = ['{}_{}.png'.format(name, i) for i in range(frames)]
+
+            def make() -> list:
+                return [self.parse_sprite(sprite_name) for sprite_name in names] + \
+                       [self.parse_flipped_sprite(sprite_name) for sprite_name in names]
+
+            images = self.get_cached(('animation', name, frames), make)
+            animation = (tuple(images[:frames]), tuple(images[frames:]))
+
+            # collision masks are made with the frames (sprites only look them up when the frame changes)
+            for image in images:
+                get_mask(image)
+            self.__animations[key] = animation
+        return animation
+
+    def get_cached(self, params: tuple, make) -> list:
+        """
+        Get images made from the sprite sheet from the disk cache (made & saved if they're not in the cache).
+        :param params: what the images are (name & processing parameters)
+        :param make: function that makes the images: make() -> list of images
+        :return: list of images
+        """
+        images = surface_cache.get([self.__filename, self.__meta_data], (self.__is_sprite,) + params, make)
+        self.__made[params] = (make, images)
+        return images
+
+    def get_files(self) -> tuple:
+        """
+        Get sprite sheet files.
+        :return: (image file, .json file)
+        """
+        return normpath(self.__filename), normpath(self.__meta_data)
+
+    def reload(self) -> int:
+        """
+        Load the changed sprite sheet again & make parsed sprites, animations & other images made from it again.
+        New pixels are copied into the shared images (& their masks), so sprites using them show the change.
+        :return: number of images that changed size (only new users get them)
+        """
+        self.__sprite_sheet = None
+        with open(self.__meta_data) as f:
+            self.__data = json.load(f)
+
+        resized = 0
+        for name, sprite in list(self.__sprites.items()):
+            new_sprite = self.__parse(name)
+            if not replace_image(sprite, new_sprite):
+                self.__sprites[name] = new_sprite
+                resized += 1
+
+        for name, sprite in list(self.__flipped_sprites.items()):
+            new_sprite = pg.transform.flip(self.__sprites[name], True, False)
+            if not replace_image(sprite, new_sprite):
+                self.__flipped_sprites[name] = new_sprite
+                resized += 1
+
+        for params, (make, images) in self.__made.items():
+            new_images = surface_cache.get([self.__filename, self.__meta_data], (self.__is_sprite,) + params, make)
+            for i, (image, new_image) in enumerate(zip(images, new_images)):
+                if not replace_image(image, new_image):
+                    images[i] = new_image
+                    resized += 1
+
+        return resized
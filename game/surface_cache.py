@@ -0,0 +1,242 @@
+from . import pg
+from .config import CACHE_DIR, DISK_CACHE, DISK_CACHE_SIZE
+from .pack import asset_pack
+from os import makedirs, replace, remove, scandir, utime
+from os.path import join, getmtime, getsize, normpath
+from hashlib import sha1
+import json
+import struct
+
+# bump when the file format changes (old files are not used any more)
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4sI')  # magic, number of surfaces
+SURFACE_HEADER = struct.Struct('<II??BBB')  # width, height, per pixel alpha, has colorkey, colorkey (r, g, b)
+
+HASH_INDEX = 'hashes.json'  # source file hashes, saved next to the cached surfaces
+
+
+class SurfaceCache:
+    """
+    Disk cache of processed (scaled, flipped, rotated...) surfaces.
+    Surfaces are saved as raw pixels & loaded with pg.image.frombuffer (no decoding & processing).
+    Files are named by a hash of the source files content & processing parameters,
+    so they're not used any more when the source or the parameters change.
+    Files that are not used any more are removed (least recently used first) when the cache is too big.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, enabled: bool = DISK_CACHE, max_size: int = DISK_CACHE_SIZE):
+        """
+        Make the cache.
+        :param directory: cache directory
+        :param enabled: use the cache (if False, surfaces are always made)
+        :param max_size: max size of the cache files (bytes)
+        """
+        self.__directory = directory
+        self.enabled = enabled
+        self.__max_size = max_size
+        self.__size = None  # size of the cache files (bytes), counted on first save
+        self.__file_hashes = None  # path -> [modification time, size, content hash], loaded on first use
+        self.__file_hashes_changed = False
+        self.hits = 0
+        self.misses = 0
+        self.removed = 0
+
+    def get(self, sources, params: tuple, make) -> list:
+        """
+        Get processed surfaces from the cache, or make them (& save them in the cache).
+        :param sources: source files the surfaces are made from
+        :param params: processing parameters (anything with a stable repr: names, sizes, angles...)
+        :param make: function that makes the surfaces: make() -> list of surfaces
+        :return: list of surfaces
+        """
+        if not self.enabled:
+            return make()
+
+        path = join(self.__directory, self.__get_key(sources, params) + '.surf')
+        if self.__file_hashes_changed:
+            self.__save_file_hashes()
+
+        surfaces = self.__load(path)
+        if surfaces is not None:
+            self.hits += 1
+            return surfaces
+
+        self.misses += 1
+        surfaces = make()
+        self.__save(path, surfaces)
+        return surfaces
+
+    def __get_file_hash(self, path: str) -> str:
+        """
+        Get hash of the file content (hashed again only when the file changes).
+        Hashes are saved next to the cache & hashes of packed files are saved in the asset pack,
+        so files are read only when they change.
+        :param path: file
+        :return: content hash
+        """
+        if self.__file_hashes is None:
+            self.__file_hashes = self.__load_file_hashes()
+
+        key = normpath(path)
+        mtime, size = getmtime(path), getsize(path)
+        cached = self.__file_hashes.get(key)
+        if cached is None or cached[:2] != [mtime, size]:
+            content_hash = asset_pack.get_hash(path, mtime, size)
+            if content_hash is None:
+                with open(path, 'rb') as f:
+                    content_hash = sha1(f.read()).hexdigest()
+            cached = [mtime, size, content_hash]
+            self.__file_hashes[key] = cached
+            self.__file_hashes_changed = True
+        return cached[2]
+
+    def __load_file_hashes(self) -> dict:
+        """
+        Load source file hashes saved next to the cache.
+        :return: path -> [modification time, size, content hash] (empty if not saved yet or broken)
+        """
+        try:
+            with open(join(self.__directory, HASH_INDEX)) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(saved, dict) or saved.get('version') != FORMAT_VERSION:
+            return {}
+        return saved.get('files', {})
+
+    def __save_file_hashes(self) -> None:
+        """
+        Save source file hashes next to the cache.
+        """
+        makedirs(self.__directory, exist_ok=True)
+        path = join(self.__directory, HASH_INDEX)
+        with open(path + '.tmp', 'w') as f:
+            json.dump({'version': FORMAT_VERSION, 'files': self.__file_hashes}, f)
+        replace(path + '.tmp', path)
+        self.__file_hashes_changed = False
+
+    def __get_key(self, sources, params: tuple) -> str:
+        """
+        Get cache key (file name).
+        :param sources: source files
+        :param params: processing parameters
+        :return: key
+        """
+        hashes = [self.__get_file_hash(source) for source in sources]
+        return sha1(repr((FORMAT_VERSION, hashes, params)).encode()).hexdigest()
+
+    @staticmethod
+    def __load(path: str):
+        """
+        Load surfaces from a cache file.
+        :param path: cache file
+        :return: list of surfaces, or None if the file doesn't exist (or is broken)
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = memoryview(f.read())
+            utime(path)  # mark as used (access times are not updated on every system)
+        except OSError:
+            return None
+
+        try:
+            magic, count = HEADER.unpack_from(data)
+            if magic != b'SURF':
+                return None
+
+            surfaces = []
+            offset = HEADER.size
+            for _ in range(count):
+                width, height, alpha, has_colorkey, r, g, b = SURFACE_HEADER.unpack_from(data, offset)
+                offset += SURFACE_HEADER.size
+
+                length = width * height * (4 if alpha else 3)
+                pixels = data[offset:offset + length]
+                offset += length
+
+                # frombuffer uses the data as it is, converting makes a copy in the display format
+                surface = pg.image.frombuffer(pixels, (width, height), 'RGBA' if alpha else 'RGB')
+                surface = surface.convert_alpha() if alpha else surface.convert()
+                if has_colorkey:
+                    surface.set_colorkey((r, g, b))
+                surfaces.append(surface)
+        except (struct.error, ValueError):
+            return None
+
+        return surfaces
+
+    def __save(self, path: str, surfaces: list) -> None:
+        """
+        Save surfaces to a cache file.
+        :param path: cache file
+        :param surfaces: list of surfaces
+        """
+        chunks = [HEADER.pack(b'SURF', len(surfaces))]
+        for surface in surfaces:
+            alpha = bool(surface.get_flags() & pg.SRCALPHA)
+            colorkey = surface.get_colorkey()
+            r, g, b = colorkey[:3] if colorkey is not None else (0, 0, 0)
+            chunks.append(SURFACE_HEADER.pack(*surface.get_size(), alpha, colorkey is not None, r, g, b))
+            # save pixels as they are (with colorkey, colorkey pixels would be saved as transparent)
+            surface.set_colorkey(None)
+            chunks.append(pg.image.tostring(surface, 'RGBA' if alpha else 'RGB'))
+            surface.set_colorkey(colorkey)
+
+        # write to a temporary file first (a half-written file is never used)
+        makedirs(self.__directory, exist_ok=True)
+        data = b''.join(chunks)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+        replace(path + '.tmp', path)
+
+        if self.__size is None:
+            self.__size = sum(size for _, _, size in self.__get_files())
+        else:
+            self.__size += len(data)
+        if self.__size > self.__max_size:
+            self.__trim()
+
+    def __get_files(self) -> list:
+        """
+        Get cache files.
+        :return: list of (last use time, file, size)
+        """
+        files = []
+        with scandir(self.__directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.surf'):
+                    try:
+                        file_stat = entry.stat()
+                    except OSError:
+                        continue  # removed by another game
+                    files.append((file_stat.st_mtime, entry.path, file_stat.st_size))
+        return files
+
+    def __trim(self) -> None:
+        """
+        Remove least recently used cache files until the cache fits its max size.
+        """
+        files = sorted(self.__get_files())
+        self.__size = sum(size for _, _, size in files)
+        for _, path, size in files:
+            if self.__size <= self.__max_size:
+                break
+            try:
+                remove(path)
+            except OSError:
+                continue
+            self.__size -= size
+            self.removed += 1
+
+    def get_stats(self) -> dict:
+        """
+        Get cache stats.
+        :return: dict with hits, misses & number of files removed to keep the cache size
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'removed': self.removed}
+
+
+# shared by all image loaders
+surface_cache = SurfaceCache()
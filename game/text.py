@@ -0,0 +1,77 @@
+from . import pg
+from .config import TEXT_CACHE_SIZE
+from .fonts import font_registry
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    Least recently used cache of rendered texts.
+    Used for menu texts, which are drawn every frame but rarely change.
+    """
+
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE):
+        """
+        Make an empty cache.
+        :param max_size: max number of rendered texts to keep
+        """
+        self.__max_size = max_size
+        self.__texts = OrderedDict()  # (text, font name, size, color) -> rendered text, least recently used first
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text: str, font_name: str, size: int, color: tuple) -> pg.Surface:
+        """
+        Get rendered text.
+        Text is rendered only if it's not in the cache.
+        :param text: text to render
+        :param font_name: font file
+        :param size: font size
+        :param color: text color
+        :return: rendered text (don't draw on it, it's shared)
+        """
+        key = (text, font_name, size, tuple(color))
+        text_surface = self.__texts.get(key)
+        if text_surface is not None:
+            self.hits += 1
+            self.__texts.move_to_end(key)
+            return text_surface
+
+        self.misses += 1
+        text_surface = font_registry.get(font_name, size).render(text, True, color)
+        self.__texts[key] = text_surface
+
+        # remove least recently used
+        if len(self.__texts) > self.__max_size:
+            self.__texts.popitem(last=False)
+
+        return text_surface
+
+    def clear(self) -> None:
+        """
+        Remove all rendered texts & reset counters.
+        """
+        self.__texts.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> dict:
+        """
+        Get cache stats.
+        :return: dict with size, max size, hits, misses & hit rate
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self.__texts),
+            'max_size': self.__max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def __len__(self) -> int:
+        """
+        Get number of cached texts.
+        :return: number of texts
+        """
+        return len(self.__texts)
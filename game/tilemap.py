@@ -1,8 +1,198 @@
 from . import pg
-from .config import WIDTH, HEIGHT
+from .config import WIDTH, HEIGHT, BLACK, MAP_CHUNK_SIZE, MAP_CHUNK_MEMORY, MAP_CHUNK_PRELOAD, MAP_PATTERN_SIZE
+from collections import OrderedDict
+from os.path import dirname, join, normpath
 import pytmx
 
 
+class MapLayer:
+    """
+    Tile layer of the map.
+    Layers are drawn straight into the map chunks (no surface per layer is kept).
+    Layers made of a repeating pattern are baked once into a small pattern surface and tiled from it,
+    the pattern is baked in the fastest format for its content:
+        1. Opaque - every tile is filled with fully opaque tiles; convert()
+        2. Color key - tiles are only fully opaque or fully transparent; convert() with RLE color key
+        3. Alpha - tiles have semi transparent pixels; convert_alpha()
+    """
+
+    COLOR_KEY = (255, 0, 255)  # transparent color for color key layers
+
+    def __init__(self, tmx_data: pytmx.TiledMap, layer: pytmx.TiledTileLayer):
+        """
+        Make a map layer.
+        :param tmx_data: tiled map data
+        :param layer: tile layer
+        """
+        self.__tmx_data = tmx_data
+        self.__layer = layer
+        self.name = layer.name
+
+        self.version = 0  # increased every time the layer changes
+
+        self.__check_format()
+        self.__find_pattern()
+
+    def __get_tiles(self) -> set:
+        """
+        Get all tile images used in the layer.
+        :return: set of tile images
+        """
+        tiles = set()
+        for row in self.__layer.data:
+            for gid in set(row):
+                tile = self.__tmx_data.get_tile_image_by_gid(gid)
+                if tile:
+                    tiles.add(tile)
+        return tiles
+
+    def __check_format(self) -> None:
+        """
+        Check if the layer is opaque & if its transparency can be done with a color key.
+        """
+        filled = all(gid and self.__tmx_data.get_tile_image_by_gid(gid) for row in self.__layer.data for gid in row)
+
+        self.opaque = filled
+        self.__color_key = True
+        for tile in self.__get_tiles():
+            area = tile.get_width() * tile.get_height()
+            visible_pixels = pg.mask.from_surface(tile, 0).count()
+            opaque_pixels = pg.mask.from_surface(tile, 254).count()
+            if opaque_pixels != area:
+                self.opaque = False
+            if opaque_pixels != visible_pixels:
+                self.__color_key = False  # semi transparent pixels
+
+    def __find_pattern(self) -> None:
+        """
+        Find the smallest repeating pattern of tiles (up to MAP_PATTERN_SIZE x MAP_PATTERN_SIZE).
+        If the layer doesn't repeat, the pattern is None.
+        """
+        self.__pattern = None
+        self.__pattern_surface = None
+
+        data = self.__layer.data
+        for pattern_height in range(1, min(MAP_PATTERN_SIZE, len(data)) + 1):
+            for pattern_width in range(1, min(MAP_PATTERN_SIZE, len(data[0])) + 1):
+                repeats = all(gid == data[y % pattern_height][x % pattern_width]
+                              for y, row in enumerate(data) for x, gid in enumerate(row))
+                if repeats:
+                    self.__pattern = (pattern_width, pattern_height)
+                    return
+
+    def is_pattern(self) -> bool:
+        """
+        Check if the layer is made of a repeating pattern.
+        :return: True/False
+        """
+        return self.__pattern is not None
+
+    def invalidate(self) -> None:
+        """
+        Mark the layer as changed (tiles or tile images).
+        Chunks with this layer are composed again when drawn next time.
+        """
+        self.version += 1
+        self.__check_format()
+        self.__find_pattern()
+
+    def __make_surface(self, size: tuple) -> pg.Surface:
+        """
+        Make an empty surface to bake the pattern onto.
+        :param size: surface size
+        :return: pygame surface
+        """
+        if self.opaque:
+            return pg.Surface(size)
+        surface = pg.Surface(size, pg.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        return surface
+
+    def __optimize(self, surface: pg.Surface) -> pg.Surface:
+        """
+        Convert the baked pattern to the display format (fastest blits).
+        :param surface: baked pattern
+        :return: converted surface
+        """
+        # display is required for converting
+        if not pg.display.get_surface():
+            return surface
+
+        # opaque
+        if self.opaque:
+            return surface.convert()
+
+        # color key (RLE)
+        if self.__color_key:
+            keyed = pg.Surface(surface.get_size()).convert()
+            keyed.fill(MapLayer.COLOR_KEY)
+            keyed.blit(surface, (0, 0))
+            keyed.set_colorkey(MapLayer.COLOR_KEY, pg.RLEACCEL)
+            return keyed
+
+        # alpha
+        return surface.convert_alpha()
+
+    def __render_tiles(self, surface: pg.Surface, area: pg.Rect) -> None:
+        """
+        Draw the layer tiles inside the area onto the surface.
+        Area top-left is drawn at surface top-left.
+        :param surface: pygame surface
+        :param area: part of the map to draw (px)
+        """
+        tile_width = self.__tmx_data.tilewidth
+        tile_height = self.__tmx_data.tileheight
+
+        # tiles inside the area
+        first_x = max(area.left // tile_width, 0)
+        first_y = max(area.top // tile_height, 0)
+        last_x = min((area.right - 1) // tile_width, self.__tmx_data.width - 1)
+        last_y = min((area.bottom - 1) // tile_height, self.__tmx_data.height - 1)
+
+        for y in range(first_y, last_y + 1):
+            row = self.__layer.data[y]
+            for x in range(first_x, last_x + 1):
+                # find the image that goes with the number (tile)
+                tile = self.__tmx_data.get_tile_image_by_gid(row[x])
+                # if there is a tile (image) with that ID, draw it on screen
+                if tile:
+                    surface.blit(tile, (x * tile_width - area.left, y * tile_height - area.top))
+
+    def __get_pattern_surface(self) -> pg.Surface:
+        """
+        Get the baked pattern (baked once).
+        :return: pattern surface
+        """
+        if self.__pattern_surface is None:
+            pattern_width = self.__pattern[0] * self.__tmx_data.tilewidth
+            pattern_height = self.__pattern[1] * self.__tmx_data.tileheight
+            pattern_area = pg.Rect(0, 0, pattern_width, pattern_height)
+            surface = self.__make_surface(pattern_area.size)
+            self.__render_tiles(surface, pattern_area)
+            self.__pattern_surface = self.__optimize(surface)
+        return self.__pattern_surface
+
+    def draw(self, surface: pg.Surface, area: pg.Rect) -> None:
+        """
+        Draw the part of the layer inside the area straight onto the surface.
+        Area top-left is drawn at surface top-left.
+        :param surface: pygame surface
+        :param area: part of the map to draw (px)
+        """
+        # repeating pattern - tile from the pattern surface
+        if self.is_pattern():
+            pattern = self.__get_pattern_surface()
+            pattern_width, pattern_height = pattern.get_size()
+            start_x = -(area.left % pattern_width)
+            start_y = -(area.top % pattern_height)
+            surface.blits([(pattern, (x, y))
+                           for y in range(start_y, area.height, pattern_height)
+                           for x in range(start_x, area.width, pattern_width)], doreturn=False)
+            return
+
+        self.__render_tiles(surface, area)
+
+
 class TiledMap:
     """
     Map made with Tiled map editor.
@@ -25,31 +215,247 @@ class TiledMap:
         # hold all this stuff so we can refer to it
         self.tmx_data = tiled_map
 
-    def __render(self, surface: pg.Surface):
-        """
-        Draw all the tiles of the map onto the surface.
-        :param surface: pygame surface
-        """
         # visible_layers - if checked as visible in tiled
-        for layer in self.tmx_data.visible_layers:
-            # if layer is of TiledTileLayer type
-            if isinstance(layer, pytmx.TiledTileLayer):
-                for x, y, gid in layer:
-                    # find the image that goes with the number (tile)
-                    tile = self.tmx_data.get_tile_image_by_gid(gid)
-                    # if there is a tile (image) with that ID, draw it on screen
-                    if tile:
-                        surface.blit(tile, (x * self.tmx_data.tilewidth, y * self.tmx_data.tileheight))
+        self.layers = [MapLayer(tiled_map, layer) for layer in tiled_map.visible_layers
+                       if isinstance(layer, pytmx.TiledTileLayer)]
+
+        # baked map chunks, least recently used first
+        # chunk column & row -> (composed surface, {layer: layer version})
+        self.__chunk_width = MAP_CHUNK_SIZE * tiled_map.tilewidth
+        self.__chunk_height = MAP_CHUNK_SIZE * tiled_map.tileheight
+        self.__chunks = OrderedDict()
+        self.__chunks_memory = 0
+
+        # chunks are scaled to this when composed (lower internal render resolution)
+        self.__scale = 1
 
     def make_map(self) -> pg.Surface:
         """
-        Create a surface to draw the map onto.
+        Create a surface to draw the whole map onto.
+        Only for small maps, the game draws the map in chunks (see draw function).
         :return: temp_surface (pg.Surface)
         """
         temp_surface = pg.Surface((self.width, self.height))
-        self.__render(temp_surface)
+        for layer in self.layers:
+            layer.draw(temp_surface, temp_surface.get_rect())
         return temp_surface
 
+    def get_layer(self, name: str) -> MapLayer:
+        """
+        Get map layer by name.
+        :param name: layer name in tiled (bg_layer, tiles_layer...)
+        :return: map layer (None if there is no such layer)
+        """
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        return None
+
+    def invalidate_layer(self, name: str) -> None:
+        """
+        Mark the layer as changed.
+        Chunks are composed again when drawn next time.
+        :param name: layer name in tiled
+        """
+        layer = self.get_layer(name)
+        if layer is not None:
+            layer.invalidate()
+
+    def get_image_files(self) -> list:
+        """
+        Get tileset image files of the map.
+        :return: list of image files
+        """
+        map_dir = dirname(self.tmx_data.filename)
+        return [normpath(join(map_dir, tileset.source)) for tileset in self.tmx_data.tilesets if tileset.source]
+
+    def reload_images(self) -> None:
+        """
+        Load tile images again (after a tileset image changed).
+        Every chunk is composed again when drawn next time.
+        """
+        self.tmx_data.reload_images()
+        for layer in self.layers:
+            layer.invalidate()
+
+    def set_scale(self, scale: float) -> None:
+        """
+        Set the scale the map is drawn at (used for lower internal render resolution).
+        Baked chunks are dropped & baked again at the new scale.
+        :param scale: render scale (1 - full resolution)
+        """
+        if scale == self.__scale:
+            return
+        self.__scale = scale
+        self.__chunks.clear()
+        self.__chunks_memory = 0
+
+    # chunks
+    def __get_chunk_rect(self, column: int, row: int) -> pg.Rect:
+        """
+        Get chunk rect (chunks at the right & bottom map edges can be smaller).
+        :param column: chunk column
+        :param row: chunk row
+        :return: chunk rect in map coordinates
+        """
+        chunk_rect = pg.Rect(column * self.__chunk_width, row * self.__chunk_height,
+                             self.__chunk_width, self.__chunk_height)
+        return chunk_rect.clip(pg.Rect(0, 0, self.width, self.height))
+
+    def __get_chunks_in(self, area: pg.Rect):
+        """
+        Get all chunks (column, row) that overlap the area.
+        :param area: area in map coordinates
+        :return: list of (column, row) tuples
+        """
+        area = area.clip(pg.Rect(0, 0, self.width, self.height))
+        if not area.w or not area.h:
+            return []
+
+        columns = range(area.left // self.__chunk_width, (area.right - 1) // self.__chunk_width + 1)
+        rows = range(area.top // self.__chunk_height, (area.bottom - 1) // self.__chunk_height + 1)
+        return [(column, row) for row in rows for column in columns]
+
+    def __get_layers_to_compose(self) -> list:
+        """
+        Get layers that can be seen.
+        Layers below the topmost opaque layer are fully covered, so they are skipped.
+        :return: list of layers
+        """
+        layers = self.layers
+        for i in range(len(layers) - 1, -1, -1):
+            if layers[i].opaque:
+                return layers[i:]
+        return layers
+
+    def __compose_chunk(self, chunk: tuple) -> tuple:
+        """
+        Compose the chunk from its layers.
+        Layers are drawn straight into the chunk, so only the composed surface is kept.
+        :param chunk: (column, row)
+        :return: composed surface, {layer: layer version}
+        """
+        area = self.__get_chunk_rect(*chunk)
+
+        # compose (layers in drawing order)
+        layers = self.__get_layers_to_compose()
+        surface = pg.Surface(area.size)
+        surface.fill(BLACK)
+        for layer in layers:
+            layer.draw(surface, area)
+
+        # scale (size is taken from the scaled map coordinates, so the chunks don't have gaps between them)
+        if self.__scale != 1:
+            surface = pg.transform.smoothscale(surface, Camera.scale_rect(area, self.__scale).size)
+
+        if pg.display.get_surface():
+            surface = surface.convert()
+
+        return surface, {layer: layer.version for layer in layers}
+
+    def __is_chunk_changed(self, layer_versions: dict) -> bool:
+        """
+        Check if any layer of the chunk changed since it was composed.
+        :param layer_versions: {layer: layer version} when the chunk was composed
+        :return: True/False
+        """
+        layers = self.__get_layers_to_compose()
+        if list(layer_versions) != layers:
+            return True
+        return any(layer_versions[layer] != layer.version for layer in layers)
+
+    def __get_chunk(self, chunk: tuple) -> pg.Surface:
+        """
+        Get a baked chunk.
+        Bake it if it's not in the cache (or if some of its layers changed) & mark it as most recently used.
+        :param chunk: (column, row)
+        :return: chunk surface
+        """
+        cached = self.__chunks.get(chunk)
+        if cached is not None:
+            if not self.__is_chunk_changed(cached[1]):
+                self.__chunks.move_to_end(chunk)
+                return cached[0]
+            self.__chunks_memory -= TiledMap.__get_chunk_memory(cached)
+
+        cached = self.__compose_chunk(chunk)
+        self.__chunks[chunk] = cached
+        self.__chunks.move_to_end(chunk)
+        self.__chunks_memory += TiledMap.__get_chunk_memory(cached)
+        return cached[0]
+
+    def __evict_chunks(self, keep) -> None:
+        """
+        Remove least recently used chunks until the cache fits the memory budget.
+        Chunks that are being drawn are never removed.
+        :param keep: chunks to keep
+        """
+        for chunk in list(self.__chunks):
+            if self.__chunks_memory <= MAP_CHUNK_MEMORY:
+                break
+            if chunk not in keep:
+                self.__chunks_memory -= TiledMap.__get_chunk_memory(self.__chunks.pop(chunk))
+
+    def __preload_chunk(self, view: pg.Rect) -> None:
+        """
+        Bake one chunk near the camera view (if any is missing), so it's ready before it comes into view.
+        Only one chunk is baked per frame to prevent stutter.
+        :param view: camera view in map coordinates
+        """
+        margin_x = self.__chunk_width * MAP_CHUNK_PRELOAD
+        margin_y = self.__chunk_height * MAP_CHUNK_PRELOAD
+        for chunk in self.__get_chunks_in(view.inflate(margin_x * 2, margin_y * 2)):
+            if chunk not in self.__chunks:
+                self.__get_chunk(chunk)
+                self.__chunks.move_to_end(chunk, last=False)  # preloaded chunks are evicted first
+                break
+
+    @staticmethod
+    def __get_chunk_memory(cached: tuple) -> int:
+        """
+        Get memory used by a chunk (composed surface).
+        :param cached: (composed surface, {layer: layer version})
+        :return: size in bytes
+        """
+        surface = cached[0]
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get_chunks_memory(self) -> int:
+        """
+        Get memory used by baked chunks.
+        :return: size in bytes
+        """
+        return self.__chunks_memory
+
+    def draw(self, surface: pg.Surface, camera) -> None:
+        """
+        Draw the map chunks that are inside the camera view.
+        If the surface has a clip set, only the chunks inside the clip are drawn.
+        If the map is scaled, the surface is the lower resolution render surface.
+        :param surface: surface to draw on (game display)
+        :param camera: camera
+        """
+        view = camera.get_view_rect()
+        scale = self.__scale
+
+        # clip in map coordinates
+        clip = surface.get_clip()
+        if scale != 1:
+            clip = pg.Rect(clip.x / scale, clip.y / scale, clip.w / scale + 2, clip.h / scale + 2)
+        clip.move_ip(view.topleft)
+
+        chunks = self.__get_chunks_in(clip)
+        for chunk in chunks:
+            chunk_rect = self.__get_chunk_rect(*chunk)
+            if scale != 1:
+                chunk_rect = camera.apply_rect_scaled(chunk_rect, scale)
+            else:
+                chunk_rect = camera.apply_rect(chunk_rect)
+            surface.blit(self.__get_chunk(chunk), chunk_rect)
+
+        self.__preload_chunk(view)
+        self.__evict_chunks(chunks)
+
 
 class Camera:
     """
@@ -90,6 +496,47 @@ class Camera:
         """
         return rect.move(self.__camera.topleft)
 
+    def apply_rect_scaled(self, rect, scale: float):
+        """
+        Applying the offset to a rect & scaling it.
+        Used when drawing at a lower internal render resolution.
+        The map position & the camera offset are scaled separately, so touching rects (map chunks) stay touching.
+
+        :param rect: a rectangle (in map coordinates)
+        :param scale: render scale
+        :return: moved & scaled rectangle
+        """
+        scaled = Camera.scale_rect(rect, scale)
+        return scaled.move(round(self.__camera.x * scale), round(self.__camera.y * scale))
+
+    def get_offset(self) -> tuple:
+        """
+        Get camera offset.
+        Used when drawing many sprites at once (add it to sprite positions).
+        :return: (x, y)
+        """
+        return self.__camera.topleft
+
+    @staticmethod
+    def scale_rect(rect, scale: float) -> pg.Rect:
+        """
+        Scale a rect, rounding its edges.
+        :param rect: a rectangle
+        :param scale: scale
+        :return: scaled rectangle
+        """
+        left = round(rect.left * scale)
+        top = round(rect.top * scale)
+        return pg.Rect(left, top, round(rect.right * scale) - left, round(rect.bottom * scale) - top)
+
+    def get_view_rect(self) -> pg.Rect:
+        """
+        Get the part of the map that is visible on screen.
+        Used for drawing only the sprites inside the camera view.
+        :return: view rect in map coordinates
+        """
+        return pg.Rect(-self.__camera.x, -self.__camera.y, WIDTH, HEIGHT)
+
     def update(self, player):
         """
         Update the camera to follow player.
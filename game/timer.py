@@ -1,6 +1,4 @@
 from . import pg
-from .config import WIDTH, HEIGHT, WHITE
-from time import strftime, gmtime
 
 
 class GameTimer:
@@ -16,7 +14,6 @@ class GameTimer:
         """
 
         self.__game = game
-        self.__font = self.__game.default_font
         self.__timer_seconds = 0
 
         pg.time.set_timer(self.__game.timer, 1000)
@@ -71,9 +68,9 @@ class GameTimer:
         """
         self.__timer_seconds += 3
 
-    def draw_timer(self) -> None:
+    def get_seconds(self) -> int:
         """
-        Draw the timer on screen.
+        Get seconds left.
+        :return: timer seconds
         """
-        timer_text = self.__font.render(strftime('%M:%S', gmtime(self.__timer_seconds)), True, WHITE)
-        self.__game.display.blit(timer_text, (WIDTH / 2, HEIGHT / 2 - 420))
+        return self.__timer_seconds